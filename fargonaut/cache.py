@@ -0,0 +1,155 @@
+"""A least-recently-used cache with a memory budget."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any
+
+
+class Cache:
+    """A least-recently-used cache, bounded by the total size of its entries.
+
+    Attributes:
+        max_bytes: The maximum total size of the cached entries
+        nbytes: The total size of the cached entries
+        hits: The number of lookups which found an entry
+        misses: The number of lookups which did not find an entry
+        evictions: The number of entries evicted to keep within max_bytes
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes (int): The maximum total size of the cached entries
+        """
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state of the cache to pickle, without its lock.
+
+        Returns:
+            dict[str, Any]: The attributes of the cache, except its lock
+        """
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_entries"] = self._entries.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of an unpickled cache, with a new lock.
+
+        Args:
+            state (dict[str, Any]): The attributes of the cache, except its lock
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether an entry is cached, without counting a lookup.
+
+        Args:
+            key (Hashable): The key of the entry
+
+        Returns:
+            bool: Whether the entry is cached
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Get the number of cached entries.
+
+        Returns:
+            int: The number of cached entries
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Look up an entry, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The key of the entry
+
+        Returns:
+            Any | None: The cached value, or None if it is not cached
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Cache an entry, evicting the least recently used entries to make room.
+
+        Entries larger than max_bytes are not cached.
+
+        Args:
+            key (Hashable): The key of the entry
+            value (Any): The value to cache
+            nbytes (int): The size of the value
+        """
+        with self._lock:
+            self._remove(key)
+            if nbytes > self._max_bytes:
+                return
+            while self._nbytes + nbytes > self._max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self.evictions += 1
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+    def evict(self, key: Hashable) -> None:
+        """Remove an entry from the cache, if it is cached.
+
+        Args:
+            key (Hashable): The key of the entry
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry from the cache without locking.
+
+        Args:
+            key (Hashable): The key of the entry
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total size of the cached entries.
+
+        Returns:
+            int: The maximum total size of the cached entries in bytes
+        """
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached entries.
+
+        Returns:
+            int: The total size of the cached entries in bytes
+        """
+        return self._nbytes
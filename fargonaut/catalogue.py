@@ -0,0 +1,268 @@
+"""A catalogue of the FARGO3D simulation outputs in a directory tree."""
+
+import json
+from collections.abc import Callable, Iterator
+from contextlib import suppress
+from os import getpid, replace, scandir
+from pathlib import Path
+
+from fargonaut.output import SNAPSHOT_PATTERN, Output
+
+# The name of the catalogue's index, stored in its root directory by default
+INDEX_FILE_NAME = ".catalogue.fargonaut"
+
+
+class Catalogue:
+    """A catalogue of the FARGO3D simulation outputs in a directory tree.
+
+    The variables, options and snapshots of every output are recorded in an index
+    file, so that outputs can be queried without reading their files. The index is
+    updated incrementally, rereading only the outputs that have changed.
+
+    Outputs are found by their variables.par file, and are not expected to contain
+    other outputs.
+
+    Attributes:
+        root: The path to the root of the directory tree
+        index: The path to the index file
+    """
+
+    def __init__(self, root: str, index: str | None = None) -> None:
+        """Open the catalogue of a directory tree.
+
+        The index is read if it exists, and is otherwise built by scanning the
+        directory tree, as it is if the index cannot be read or is corrupt. Call
+        update to find changes made since the index was saved.
+
+        Args:
+            root (str): The path to the root of the directory tree
+            index (str | None): The path to the index file, by default stored in
+                                the root directory
+        """
+        self._root = Path(root)
+        self._index = Path(index) if index is not None else self._root / INDEX_FILE_NAME
+        try:
+            with open(self._index) as fid:
+                records = json.load(fid)["outputs"]
+        except (OSError, ValueError, KeyError, TypeError):
+            records = None
+        if isinstance(records, dict):
+            self._records: dict[str, dict] = records
+        else:
+            self._records = {}
+            self.update()
+
+    def __len__(self) -> int:
+        """Get the number of catalogued outputs.
+
+        Returns:
+            int: The number of catalogued outputs
+        """
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Output]:
+        """Iterate over the catalogued outputs.
+
+        Returns:
+            Iterator[Output]: The catalogued outputs, in order of directory
+        """
+        for directory in sorted(self._records):
+            yield self._output(directory)
+
+    def update(self) -> None:
+        """Scan the directory tree for changes to its outputs and save the index.
+
+        An output is reread only if its directory, variables file or summary0 file
+        have been modified since it was last read. Outputs whose variables file
+        cannot be read or parsed are left out of the catalogue.
+        """
+        records = {}
+        stack = [self._root]
+        while stack:
+            path = stack.pop()
+            directory = path.relative_to(self._root).as_posix()
+            try:
+                mtimes = _mtimes(path)
+            except OSError:
+                continue
+            record = self._records.get(directory)
+            if record is not None and record["mtimes"] == mtimes:
+                records[directory] = record
+                continue
+
+            files, subdirectories = [], []
+            try:
+                with scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(Path(entry.path))
+                        else:
+                            files.append(entry.name)
+            except OSError:
+                continue
+            if "variables.par" in files:
+                try:
+                    records[directory] = _record(path, mtimes, files)
+                except (OSError, ValueError):
+                    continue
+            else:
+                stack.extend(subdirectories)
+        self._records = records
+        self._save()
+
+    def query(self, predicate: Callable[[Output], bool] | None = None) -> list[Output]:
+        """Find the catalogued outputs satisfying a condition.
+
+        The outputs are given the variables and options recorded in the index, so
+        evaluating the condition reads no files, e.g. to find cylindrical MHD runs
+        with at least 1024 cells in x::
+
+            catalogue.query(
+                lambda output: output.coordinate_system == "cylindrical"
+                and output.nx >= 1024
+                and output.get_opt("MHD")
+            )
+
+        Args:
+            predicate (Callable[[Output], bool] | None): The condition, or None to
+                                                         find every output
+
+        Returns:
+            list[Output]: The outputs satisfying the condition, in order of
+                          directory
+        """
+        return [output for output in self if predicate is None or predicate(output)]
+
+    def snapshots(self, output: Output | str, field: str) -> list[int]:
+        """Get the output numbers at which a field was written.
+
+        Args:
+            output (Output | str): The output, or the path to its directory
+            field (str): The name of the field, e.g. gasdens
+
+        Returns:
+            list[int]: The sorted output numbers
+
+        Raises:
+            KeyError: If the output is not catalogued
+        """
+        directory = output._directory if isinstance(output, Output) else Path(output)
+        if not directory.is_absolute():
+            directory = self._root / directory
+        record = self._records[directory.relative_to(self._root).as_posix()]
+        return record["snapshots"].get(field, [])
+
+    def _output(self, directory: str) -> Output:
+        """Open a catalogued output, using the variables and options in the index.
+
+        Outputs whose options are unknown are given no options, rather than
+        rereading their summary0 file.
+
+        Args:
+            directory (str): The path to the output, relative to the root
+
+        Returns:
+            Output: The output
+        """
+        record = self._records[directory]
+        output = Output(self._root / directory)
+        output._vars = dict(record["vars"])
+        output._opts = tuple(record["opts"] or ())
+        return output
+
+    def _save(self) -> None:
+        """Save the index, replacing the previous index once it is written.
+
+        If the index cannot be written, e.g. in a read-only directory, the
+        catalogue is kept in memory only.
+        """
+        temp_index = self._index.with_name(f"{self._index.name}.{getpid()}")
+        try:
+            with open(temp_index, "w") as fid:
+                json.dump({"outputs": self._records}, fid)
+            replace(temp_index, self._index)
+        except OSError:
+            with suppress(OSError):
+                temp_index.unlink(missing_ok=True)
+
+    @property
+    def root(self) -> Path:
+        """The root of the directory tree.
+
+        Returns:
+            Path: The path to the root of the directory tree
+        """
+        return self._root
+
+    @property
+    def index(self) -> Path:
+        """The index file of the catalogue.
+
+        Returns:
+            Path: The path to the index file
+        """
+        return self._index
+
+
+def _mtimes(path: Path) -> list[int | None]:
+    """Get the modification times of a directory and its output metadata files.
+
+    Adding or removing snapshots modifies the directory, while the metadata files
+    may be rewritten in place.
+
+    Args:
+        path (Path): The path to the directory
+
+    Returns:
+        list[int | None]: The modification times of the directory, variables file
+                          and summary0 file, or None for missing files
+
+    Raises:
+        OSError: If the directory cannot be accessed
+    """
+    mtimes: list[int | None] = [path.stat().st_mtime_ns]
+    for name in ("variables.par", "summary0.dat"):
+        try:
+            mtimes.append((path / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return mtimes
+
+
+def _record(path: Path, mtimes: list[int | None], files: list[str]) -> dict:
+    """Read the index record of an output.
+
+    Args:
+        path (Path): The path to the output directory
+        mtimes (list[int | None]): The modification times of the directory,
+                                   variables file and summary0 file
+        files (list[str]): The names of the files in the directory
+
+    Returns:
+        dict: The modification times, variables, options and snapshots of the
+              output, with options of None if the summary0 file is missing or
+              has no compilation option section
+
+    Raises:
+        OSError: If the variables file cannot be read
+        ValueError: If the variables file cannot be parsed
+    """
+    output = Output(path)
+    output._read_vars()
+    opts = None
+    if mtimes[2] is not None:
+        try:
+            opts = list(output._opts)
+        except (OSError, ValueError):
+            pass
+    snapshots: dict[str, set[int]] = {}
+    for name in files:
+        match = SNAPSHOT_PATTERN.match(name)
+        if match:
+            snapshots.setdefault(match[1], set()).add(int(match[2]))
+    return {
+        "mtimes": mtimes,
+        "vars": output._vars,
+        "opts": opts,
+        "snapshots": {field: sorted(nums) for field, nums in snapshots.items()},
+    }
@@ -0,0 +1,82 @@
+"""Level-of-detail downsampling of field slices for plotting."""
+
+from math import ceil
+
+from matplotlib.axes import Axes
+from numpy import (
+    add,
+    append,
+    arange,
+    diff,
+    float64,
+    inexact,
+    issubdtype,
+    ix_,
+    maximum,
+    minimum,
+    outer,
+)
+from numpy.typing import NDArray
+
+# The reductions combining the values of each block of cells
+REDUCTIONS = {"mean": add, "min": minimum, "max": maximum}
+
+
+def downsample(
+    X: NDArray[float64],
+    Y: NDArray[float64],
+    C: NDArray[float64],
+    shape: tuple[int, int],
+    method: str = "mean",
+) -> tuple[NDArray[float64], NDArray[float64], NDArray[float64]]:
+    """Downsample a 2D slice of a field and the grids of its cell edges.
+
+    Blocks of cells are combined so that the slice has at most shape cells. The
+    blocks are bounded by edges of the original cells, so the downsampled grids are
+    subsets of the original grids, whatever coordinate system they are projected on.
+    The means of integer or boolean values, e.g. masks, are floating point.
+
+    Args:
+        X (NDArray): The x-coordinates of the cell edges
+        Y (NDArray): The y-coordinates of the cell edges
+        C (NDArray): The field values
+        shape (tuple[int, int]): The maximum number of cells in each dimension
+        method (str): How the values of each block are combined, either "mean",
+                      "min" or "max"
+
+    Returns:
+        tuple[NDArray, NDArray, NDArray]: The downsampled x- and y-coordinates of
+                                          the cell edges, and field values
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method not in REDUCTIONS:
+        raise ValueError(f"Unknown downsampling method {method}")
+    factors = [ceil(n / max(1, m)) for n, m in zip(C.shape, shape, strict=True)]
+    if factors == [1, 1]:
+        return X, Y, C
+
+    starts = [arange(0, n, f) for n, f in zip(C.shape, factors, strict=True)]
+    reduction = REDUCTIONS[method]
+    if method == "mean" and not issubdtype(C.dtype, inexact):
+        C = C.astype(float64)
+    data = reduction.reduceat(reduction.reduceat(C, starts[0], axis=0), starts[1], 1)
+    edges = [append(start, n) for start, n in zip(starts, C.shape, strict=True)]
+    if method == "mean":
+        data /= outer(diff(edges[0]), diff(edges[1]))
+    grid = ix_(*edges)
+    return X[grid], Y[grid], data
+
+
+def resolution(axs: Axes) -> int:
+    """Get the resolution of a set of axes, in pixels.
+
+    Args:
+        axs (Axes): The axes
+
+    Returns:
+        int: The larger of the width and height of the axes in pixels
+    """
+    bbox = axs.get_window_extent()
+    return max(1, ceil(max(bbox.width, bbox.height)))
@@ -1,19 +1,87 @@
 """A field handler."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from functools import partial
+from math import prod
+from numbers import Number, Real
+from threading import Lock, RLock
+from typing import Any
+from weakref import WeakSet
 
 import matplotlib.pyplot as plt
-from numpy import float64, reshape
-from numpy.typing import NDArray
+from matplotlib.axes import Axes
+from matplotlib.collections import QuadMesh
+from matplotlib.lines import Line2D
+from numpy import (
+    add,
+    array_equal,
+    asarray,
+    concatenate,
+    divide,
+    empty,
+    float64,
+    fromfile,
+    memmap,
+    multiply,
+    ndarray,
+    power,
+    reshape,
+    subtract,
+    ufunc,
+)
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from fargonaut.downsample import downsample, resolution
+
+# The number of values evaluated at once when evaluating a derived field
+BLOCK_SIZE = 32768
+
+# The maximum number of unevaluated derived fields chained in a fused evaluation
+MAX_FUSED_DEPTH = 32
+
+# The attributes which derived fields take from the class of the field derived from
+BASE_ATTRIBUTES = (
+    "_get_2D_cartesian_plot_data",
+    "_get_2D_cylindrical_plot_data",
+    "_get_2D_spherical_plot_data",
+    "_get_1D_cartesian_plot_data",
+    "_get_1D_cylindrical_plot_data",
+    "_get_1D_spherical_plot_data",
+    "x",
+    "y",
+    "z",
+    "raw",
+    "data",
+)
+
+# The subclasses of DerivedField for each class of field derived from
+_derived_classes: dict[type, type] = {}
+_derived_classes_lock = Lock()
+
+# The symbols of the results of arithmetic ufuncs, given those of their operands
+OPERATOR_SYMBOLS = {
+    add: "{} + {}",
+    subtract: "{} - {}",
+    multiply: r"{} \times {}",
+    divide: "{} / {}",
+    power: "{}^{}",
+}
 
 
 class Field(ABC):
     """An abstract base field."""
 
+    # The grid registry of the output and the staggered dimension of the field,
+    # which identify the coordinates at which the field data are defined
+    _grid: tuple | None = None
+
     def _check_valid_for_arithmetic(self, other: "Field", operation: "str") -> None:
         """Check if two fields are suitable for arithmetic operations.
 
-        Fields must be defined at the same coordinates in order to be valid.
+        Fields must be defined at the same coordinates in order to be valid. Fields
+        of the same output and staggering are compatible without comparing their
+        coordinates.
 
         Args:
             other (Field): The field on the RHS of the operator.
@@ -25,94 +93,507 @@ class Field(ABC):
         """
         if not isinstance(other, Field) and not isinstance(other, DerivedField):
             raise Exception(f"{other} is of an invalid class.")
-        if (
-            (self._xdata != other._xdata).all()
-            or (self._ydata != other._ydata).all()
-            or (self._zdata != other._zdata).all()
+        if self._grid is not None and self._grid == other._grid:
+            return
+        if not (
+            array_equal(self._xdata, other._xdata)
+            and array_equal(self._ydata, other._ydata)
+            and array_equal(self._zdata, other._zdata)
         ):
             raise Exception(
                 f"Cannot {operation} fields defined at different coordinates."
             )
 
-    def __add__(self, other: "Field") -> "DerivedField":
-        """Add one field to another.
+    def __add__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Add a field, scalar or array to the field.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be added.
+
+        Returns:
+            DerivedField: The sum.
+        """
+        other = self._operand(other, "add")
+        result = DerivedField(self, add, (self, other))
+        result.symbol = f"{self.symbol} + {_symbol(other)}"
+        return result
+
+    def __radd__(self, other: ArrayLike) -> "DerivedField":
+        """Add the field to a scalar or array.
+
+        Args:
+            other (ArrayLike): The scalar or array to be added to.
+
+        Returns:
+            DerivedField: The sum.
+        """
+        other = self._operand(other, "add")
+        result = DerivedField(self, add, (other, self))
+        result.symbol = f"{_symbol(other)} + {self.symbol}"
+        return result
+
+    def __sub__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Subtract a field, scalar or array from the field.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be subtracted.
+
+        Returns:
+            DerivedField: The difference.
+        """
+        other = self._operand(other, "subtract")
+        result = DerivedField(self, subtract, (self, other))
+        result.symbol = f"{self.symbol} - {_symbol(other)}"
+        return result
+
+    def __rsub__(self, other: ArrayLike) -> "DerivedField":
+        """Subtract the field from a scalar or array.
 
         Args:
-            other (Field): The field to be added.
+            other (ArrayLike): The scalar or array to be subtracted from.
 
         Returns:
-            DerivedField: The sum of the two fields.
+            DerivedField: The difference.
         """
-        self._check_valid_for_arithmetic(other, "add")
-        result = DerivedField(self)
-        result.symbol = f"{self.symbol} + {other.symbol}"
-        result._raw = self._raw + other._raw
-        result._data = self._data + other._data
+        other = self._operand(other, "subtract")
+        result = DerivedField(self, subtract, (other, self))
+        result.symbol = f"{_symbol(other)} - {self.symbol}"
         return result
 
-    def __sub__(self, other) -> "DerivedField":
-        """Subtract one field from another.
+    def __mul__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Multiply the field by a field, scalar or array.
 
         Args:
-            other (Field): The field to be subtracted.
+            other (Field | ArrayLike): The field, scalar or array to be multiplied by.
 
         Returns:
-            DerivedField: The difference of the two fields.
+            DerivedField: The product.
         """
-        self._check_valid_for_arithmetic(other, "subtract")
-        result = DerivedField(self)
-        result.symbol = f"{self.symbol} - {other.symbol}"
-        result._raw = self._raw - other._raw
-        result._data = self._data - other._data
+        other = self._operand(other, "multiply")
+        result = DerivedField(self, multiply, (self, other))
+        result.symbol = rf"{self.symbol} \times {_symbol(other)}"
         return result
 
-    def __mul__(self, other) -> "DerivedField":
-        """Multiply one field by another.
+    def __rmul__(self, other: ArrayLike) -> "DerivedField":
+        """Multiply a scalar or array by the field.
 
         Args:
-            other (Field): The field to be multiplied by.
+            other (ArrayLike): The scalar or array to be multiplied.
 
         Returns:
-            DerivedField: The product of the two fields.
+            DerivedField: The product.
         """
-        self._check_valid_for_arithmetic(other, "multiply")
-        result = DerivedField(self)
-        result.symbol = rf"{self.symbol} \times {other.symbol}"
-        result._raw = self._raw * other._raw
-        result._data = self._data * other._data
+        other = self._operand(other, "multiply")
+        result = DerivedField(self, multiply, (other, self))
+        result.symbol = rf"{_symbol(other)} \times {self.symbol}"
         return result
 
-    def __truediv__(self, other) -> "DerivedField":
-        """Divide one field by another.
+    def __truediv__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Divide the field by a field, scalar or array.
 
         Args:
-            other (Field): The field to be divided by.
+            other (Field | ArrayLike): The field, scalar or array to be divided by.
 
         Returns:
-            DerivedField: The ratio of the two fields.
+            DerivedField: The ratio.
         """
-        self._check_valid_for_arithmetic(other, "divide")
-        result = DerivedField(self)
-        result.symbol = f"{self.symbol} / {other.symbol}"
-        result._raw = self._raw / other._raw
-        result._data = self._data / other._data
+        other = self._operand(other, "divide")
+        result = DerivedField(self, divide, (self, other))
+        result.symbol = f"{self.symbol} / {_symbol(other)}"
         return result
 
-    def __pow__(self, power: float | int) -> "DerivedField":
+    def __rtruediv__(self, other: ArrayLike) -> "DerivedField":
+        """Divide a scalar or array by the field.
+
+        Args:
+            other (ArrayLike): The scalar or array to be divided.
+
+        Returns:
+            DerivedField: The ratio.
+        """
+        other = self._operand(other, "divide")
+        result = DerivedField(self, divide, (other, self))
+        result.symbol = f"{_symbol(other)} / {self.symbol}"
+        return result
+
+    def __pow__(self, exponent: "Field | ArrayLike") -> "DerivedField":
         """Raise the field data to a power.
 
         Args:
-            power (float | int): The power to raise the field to.
+            exponent (Field | ArrayLike): The power to raise the field to.
 
         Returns:
             DerivedField: The field with data raised to the requested power.
         """
-        result = DerivedField(self)
-        result.symbol = f"{self.symbol}^{power}"
-        result._raw = self._raw**power
-        result._data = self._data**power
+        exponent = self._operand(exponent, "exponentiate")
+        result = DerivedField(self, power, (self, exponent))
+        result.symbol = f"{self.symbol}^{_symbol(exponent)}"
         return result
 
+    def __rpow__(self, base: ArrayLike) -> "DerivedField":
+        """Raise a scalar or array to the power of the field data.
+
+        Args:
+            base (ArrayLike): The scalar or array to raise to the field's power.
+
+        Returns:
+            DerivedField: The base raised to the power of the field data.
+        """
+        base = self._operand(base, "exponentiate")
+        result = DerivedField(self, power, (base, self))
+        result.symbol = f"{_symbol(base)}^{{{self.symbol}}}"
+        return result
+
+    def add(
+        self, other: "Field | ArrayLike", out: "DerivedField | None" = None
+    ) -> "DerivedField":
+        """Add a field, scalar or array to the field.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be added.
+            out (DerivedField | None): The derived field to write the sum into, or
+                                       None to derive a new field.
+
+        Returns:
+            DerivedField: The sum.
+        """
+        if out is None:
+            return self + other
+        operands = (self, self._operand(other, "add"))
+        return self._write(out, add, operands, "add")
+
+    def subtract(
+        self, other: "Field | ArrayLike", out: "DerivedField | None" = None
+    ) -> "DerivedField":
+        """Subtract a field, scalar or array from the field.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be subtracted.
+            out (DerivedField | None): The derived field to write the difference
+                                       into, or None to derive a new field.
+
+        Returns:
+            DerivedField: The difference.
+        """
+        if out is None:
+            return self - other
+        operands = (self, self._operand(other, "subtract"))
+        return self._write(out, subtract, operands, "subtract")
+
+    def multiply(
+        self, other: "Field | ArrayLike", out: "DerivedField | None" = None
+    ) -> "DerivedField":
+        """Multiply the field by a field, scalar or array.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be multiplied by.
+            out (DerivedField | None): The derived field to write the product into, or
+                                       None to derive a new field.
+
+        Returns:
+            DerivedField: The product.
+        """
+        if out is None:
+            return self * other
+        operands = (self, self._operand(other, "multiply"))
+        return self._write(out, multiply, operands, "multiply")
+
+    def divide(
+        self, other: "Field | ArrayLike", out: "DerivedField | None" = None
+    ) -> "DerivedField":
+        """Divide the field by a field, scalar or array.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be divided by.
+            out (DerivedField | None): The derived field to write the ratio into, or
+                                       None to derive a new field.
+
+        Returns:
+            DerivedField: The ratio.
+        """
+        if out is None:
+            return self / other
+        operands = (self, self._operand(other, "divide"))
+        return self._write(out, divide, operands, "divide")
+
+    def power(
+        self, exponent: "Field | ArrayLike", out: "DerivedField | None" = None
+    ) -> "DerivedField":
+        """Raise the field data to a power.
+
+        Args:
+            exponent (Field | ArrayLike): The power to raise the field to.
+            out (DerivedField | None): The derived field to write the result into,
+                                       or None to derive a new field.
+
+        Returns:
+            DerivedField: The field with data raised to the requested power.
+        """
+        if out is None:
+            return self**exponent
+        operands = (self, self._operand(exponent, "exponentiate"))
+        return self._write(out, power, operands, "exponentiate")
+
+    def _write(
+        self,
+        out: "DerivedField | NDArray",
+        operation: Callable[..., NDArray[float64]],
+        operands: tuple[Any, ...],
+        verb: str,
+    ) -> "DerivedField | NDArray":
+        """Write the result of an operation on the field into a derived field or array.
+
+        Args:
+            out (DerivedField | NDArray): The derived field, or array of the shape of
+                                          the field data, to write into.
+            operation (Callable): The operation, a ufunc accepting an out argument.
+            operands (tuple[Any, ...]): The checked and prepared operands.
+            verb (str): The name of the operation.
+
+        Returns:
+            DerivedField | NDArray: The derived field or array written into.
+
+        Raises:
+            Exception: If out is not a derived field or array.
+            Exception: If out is incompatible with the field.
+            ValueError: If out is an array of a different shape to the field data.
+        """
+        if isinstance(out, DerivedField):
+            self._check_valid_for_arithmetic(out, verb)
+            out._assign(operation, operands)
+        elif isinstance(out, ndarray):
+            shape = (len(self._xdata), len(self._ydata), len(self._zdata))
+            if out.shape != shape:
+                raise ValueError(
+                    f"Cannot {verb} into an array of shape {out.shape}, as the field "
+                    f"has shape {shape}."
+                )
+            _evaluate_into(out, operation, operands)
+        else:
+            raise Exception(
+                f"Cannot {verb} into {out}, as it is not a derived field or array."
+            )
+        return out
+
+    def __array_ufunc__(
+        self, ufunc: ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        """Apply a numpy ufunc to the field.
+
+        Calling a ufunc with a single output on fields, e.g. numpy.sqrt(field),
+        derives a new field in the same way as the arithmetic operators, or writes
+        into the derived field or array given as out. As the field is evaluated in
+        blocks, the other keyword arguments, e.g. dtype, must not be arrays, and
+        where is not supported. Other ufunc methods, e.g. numpy.add.reduce, operate
+        directly on the field values.
+
+        Args:
+            ufunc (ufunc): The ufunc.
+            method (str): The name of the ufunc method called.
+            inputs (Any): The fields, scalars and arrays operated on.
+            kwargs (Any): The keyword arguments of the ufunc.
+
+        Returns:
+            Any: The derived field, the derived field or array written into, or the
+                 result of the ufunc method
+
+        Raises:
+            ValueError: If where or another array-valued keyword argument is given
+                        when calling the ufunc on fields.
+        """
+        fields = [x for x in inputs if isinstance(x, Field | DerivedField)]
+        if method != "__call__" or ufunc.nout != 1 or not fields:
+            return getattr(ufunc, method)(*_unwrap(inputs), **_unwrap(kwargs))
+
+        base = fields[0]
+        verb = f"apply {ufunc.__name__} to"
+        (out,) = kwargs.pop("out", (None,))
+        for key, value in kwargs.items():
+            arraylike = isinstance(value, ndarray | list | Field | DerivedField)
+            if (key == "where" and value is not True) or arraylike:
+                raise ValueError(
+                    f"Cannot {verb} fields with the {key} argument, as fields are "
+                    "evaluated in blocks."
+                )
+        operation = partial(ufunc, **kwargs) if kwargs else ufunc
+        operands = tuple(base._operand(x, verb) for x in inputs)
+        if out is not None:
+            return base._write(out, operation, operands, verb)
+        result = DerivedField(base, operation, operands)
+        result.symbol = _ufunc_symbol(ufunc, operands)
+        return result
+
+    def __array_function__(
+        self,
+        func: Callable,
+        types: tuple[type, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Apply a numpy function to the field values.
+
+        Functions such as numpy.mean or numpy.max operate directly on the field
+        values, without copying them, and return arrays.
+
+        Args:
+            func (Callable): The numpy function.
+            types (tuple[type, ...]): The types of the arguments implementing the
+                                      numpy function protocol.
+            args (tuple[Any, ...]): The positional arguments of the function.
+            kwargs (dict[str, Any]): The keyword arguments of the function.
+
+        Returns:
+            Any: The result of the function
+        """
+        return func(*_unwrap(args), **_unwrap(kwargs))
+
+    def __array__(
+        self, dtype: DTypeLike | None = None, copy: bool | None = None
+    ) -> NDArray:
+        """Get the field values as a numpy array, e.g. for numpy.asarray(field).
+
+        Args:
+            dtype (DTypeLike | None): The data type of the array, or None to keep
+                                      that of the field values.
+            copy (bool | None): Whether to copy the field values, or None to copy
+                                them only if converting them to another data type.
+
+        Returns:
+            NDArray: The shaped field values
+        """
+        values = self._data
+        if dtype is not None and values.dtype != dtype:
+            if copy is False:
+                raise ValueError("Cannot convert the field values without a copy.")
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def _operand(self, other: Any, operation: str) -> Any:
+        """Check and prepare a value to operate on the field with.
+
+        Fields must be defined at the same coordinates. Scalars are used as they
+        are. Arrays must broadcast against the shaped field data, and a 1D array is
+        broadcast along the dimension of the same length, e.g. a radial profile
+        along y in cylindrical coordinates. Arrays are reshaped rather than copied,
+        so are never expanded to the size of the field.
+
+        Args:
+            other (Any): The field, scalar or array to operate with.
+            operation (str): The name of the operation.
+
+        Returns:
+            Any: The field or scalar, or a view of the array which broadcasts
+                 against the field data
+
+        Raises:
+            Exception: If other is not a field or numeric.
+            Exception: If the fields are incompatible.
+            ValueError: If the array does not broadcast against the field data.
+        """
+        if isinstance(other, Field | DerivedField):
+            self._check_valid_for_arithmetic(other, operation)
+            return other
+        if isinstance(other, Number):
+            return other
+        values = asarray(other)
+        if values.dtype.kind not in "biufc":
+            raise Exception(f"{other} is of an invalid class.")
+        if values.ndim == 0:
+            return values[()]
+
+        shape = (len(self._xdata), len(self._ydata), len(self._zdata))
+        if values.ndim == 1:
+            axes = [axis for axis, n in enumerate(shape) if n == values.size]
+            if len(axes) != 1:
+                raise ValueError(
+                    f"Cannot {operation} {values.size} values along a single "
+                    f"dimension of a field of shape {shape}."
+                )
+            values = values.reshape([-1 if axis in axes else 1 for axis in range(3)])
+        if values.ndim != 3 or any(
+            m not in (1, n) for m, n in zip(values.shape, shape, strict=True)
+        ):
+            raise ValueError(
+                f"Cannot {operation} values of shape {values.shape} and a field of "
+                f"shape {shape}."
+            )
+        return values
+
+    def _read(self, filename: str) -> NDArray[float64]:
+        """Read the field data from a file.
+
+        If the field was requested with mmap, the file is memory-mapped read-only,
+        so that data are only read from disk when they are accessed. The data are
+        read with the floating point precision of the output. If the file does not
+        exist, the field is assembled from the files written by each MPI process,
+        which cannot be memory-mapped.
+
+        Args:
+            filename (str): The path to the field data file
+
+        Returns:
+            NDArray: The field data
+        """
+        try:
+            if self._mmap:
+                return memmap(filename, dtype=self._output.dtype, mode="r")
+            return fromfile(filename, dtype=self._output.dtype)
+        except FileNotFoundError:
+            return self._output._read_unmerged(filename)
+
+    def astype(self, dtype: DTypeLike) -> "DerivedField":
+        """Convert the field values to another data type.
+
+        Fields keep the floating point precision of the output they are read from,
+        so this can be used to upcast a single-precision field to double precision.
+
+        Args:
+            dtype (DTypeLike): The data type to convert to.
+
+        Returns:
+            DerivedField: The field with values of the requested data type.
+        """
+        return DerivedField(self, partial(asarray, dtype=dtype), (self,))
+
+    def centred(
+        self, out: "DerivedField | NDArray | None" = None
+    ) -> "DerivedField | NDArray":
+        """Interpolate a staggered field to the cell centres.
+
+        Each value is the mean of those at the lower and upper faces of the cell,
+        so the result is defined at the same coordinates as scalar fields such as
+        the density, and can be combined with them and with the other components of
+        vector fields. The x dimension is periodic, so the upper faces of the last
+        cells in x are the lower faces of the first. In y and z, unless FARGO3D was
+        compiled with PERIODICY or PERIODICZ, the upper faces of the last cells are
+        not in the output, so the values at their lower faces are used.
+
+        Args:
+            out (DerivedField | NDArray | None): The derived field or array to write
+                                                 the centred values into, or None to
+                                                 derive a new field.
+
+        Returns:
+            DerivedField | NDArray: The centred field, or the derived field or array
+                                    written into
+
+        Raises:
+            ValueError: If the field is defined at the cell centres.
+        """
+        grids, staggering = self._grid
+        if staggering is None:
+            raise ValueError("Cannot centre a field defined at the cell centres.")
+        periodic = staggering == "x" or self._output.get_opt(
+            f"PERIODIC{staggering.upper()}"
+        )
+        operands = (self, _UpperFaces(self, "xyz".index(staggering), periodic))
+        result = DerivedField(self, _midpoint, operands)
+        result._xdata, result._ydata, result._zdata = grids.coordinates()
+        result._grid = (grids, None)
+        if out is None:
+            return result
+        return result._write(out, _midpoint, operands, "centre")
+
     @abstractmethod
     def _load(self, num: int) -> None:
         """Load the field data from file.
@@ -230,18 +711,96 @@ class Field(ABC):
             axis: The axes containing the plot
         """
 
+    def _get_2D_plot_data(
+        self, csys: str, dims: str, idx: int
+    ) -> tuple[NDArray[float64], NDArray[float64], NDArray[float64], str, str, str]:
+        """Get the grids, values and labels of a 2D slice of the field.
+
+        Args:
+            csys (str): The coordinate system on which to plot the field
+            dims (str): The dimensions of the field to plot
+            idx (int): The index of the slice to plot
+
+        Returns:
+            tuple[NDArray, NDArray, NDArray, str, str, str]: The x and y grids, the
+                field values, and the x, y and field labels
+
+        Raises:
+            NotImplementedError: If unknown coordinate system requested
+        """
+        if self._output.coordinate_system == "cartesian":
+            return self._get_2D_cartesian_plot_data(csys, dims, idx)
+        elif self._output.coordinate_system == "cylindrical":
+            return self._get_2D_cylindrical_plot_data(csys, dims, idx)
+        elif self._output.coordinate_system == "spherical":
+            return self._get_2D_spherical_plot_data(csys, dims, idx)
+        raise NotImplementedError(f"Unable to plot on coordinate system {csys}")
+
+    def _get_1D_plot_data(
+        self, csys: str, dims: str, idx: int
+    ) -> tuple[NDArray[float64], NDArray[float64], str, str]:
+        """Get the grid, values and labels of a 1D slice of the field.
+
+        Args:
+            csys (str): The coordinate system on which to plot the field
+            dims (str): The dimension of the field to plot
+            idx (int): The indices of the slice to plot
+
+        Returns:
+            tuple[NDArray, NDArray, str, str]: The grid, the field values, and the
+                grid and field labels
+
+        Raises:
+            NotImplementedError: If unknown coordinate system requested
+        """
+        if self._output.coordinate_system == "cartesian":
+            return self._get_1D_cartesian_plot_data(csys, dims, idx)
+        elif self._output.coordinate_system == "cylindrical":
+            return self._get_1D_cylindrical_plot_data(csys, dims, idx)
+        elif self._output.coordinate_system == "spherical":
+            return self._get_1D_spherical_plot_data(csys, dims, idx)
+        raise NotImplementedError(f"Unable to plot on coordinate system {csys}")
+
     def plot(
-        self, csys: str = "polar", dims: str = "xy", idx: int = 0
+        self,
+        csys: str = "polar",
+        dims: str = "xy",
+        idx: int = 0,
+        ax: Axes | None = None,
+        show: bool | None = None,
+        artist: QuadMesh | Line2D | None = None,
+        lod: bool | int = True,
+        lod_method: str = "mean",
     ) -> tuple[plt.figure, plt.subplot, plt.colorbar] | tuple[plt.figure, plt.subplot]:
         """Plot the field.
 
         dims can be "xy", "xz", "yz", "yx", "zx", "zy", taking a 2D slice of 3D data
         idx is the index at which to slice in the third dimension
 
+        By default, a new figure is created and shown. Pass ax to plot into existing
+        axes instead, or artist to replace the values of an existing plot of a field
+        on the same grid, e.g. to step through output times without redrawing the
+        whole figure.
+
+        2D slices with more cells than the axes have pixels are downsampled before
+        plotting, combining blocks of cells by lod_method, so that the time taken to
+        plot depends on the size of the figure rather than of the grid.
+
         Args:
             csys (str): The coordinate system on which to plot the field
             dims (str): The dimensions of the field to plot
             idx (int): The index of the slice to plot
+            ax (Axes | None): The axes to plot into, or None to create a new figure
+            show (bool | None): Whether to show the figure, or None to show it only
+                                if a new figure is created
+            artist (QuadMesh | Line2D | None): The mesh or line of an existing plot
+                                              to update, e.g. cb.mappable or
+                                              axs.lines[0]
+            lod (bool | int): Whether to downsample 2D slices to the resolution of
+                              the axes, or the maximum number of cells to plot in
+                              each dimension
+            lod_method (str): How blocks of cells are combined when downsampling,
+                              either "mean", "min" or "max"
 
         Returns:
             figure: The figure containing the plot
@@ -251,48 +810,61 @@ class Field(ABC):
         Raises:
             NotImplementedError: If unknown coordinate system requested
         """
+        if show is None:
+            show = ax is None and artist is None
         if len(dims) == 2:
-            if self._output.coordinate_system == "cartesian":
-                X, Y, C, xlabel, ylabel, clabel = self._get_2D_cartesian_plot_data(
-                    csys, dims, idx
-                )
-            elif self._output.coordinate_system == "cylindrical":
-                X, Y, C, xlabel, ylabel, clabel = self._get_2D_cylindrical_plot_data(
-                    csys, dims, idx
-                )
-            elif self._output.coordinate_system == "spherical":
-                X, Y, C, xlabel, ylabel, clabel = self._get_2D_spherical_plot_data(
-                    csys, dims, idx
-                )
+            X, Y, C, xlabel, ylabel, clabel = self._get_2D_plot_data(csys, dims, idx)
+            if artist is not None:
+                if lod:
+                    X, Y, C = downsample(X, Y, C, artist.get_array().shape, lod_method)
+                artist.set_array(C)
+                artist.autoscale()
+                fig, axs, cb = artist.figure, artist.axes, artist.colorbar
+                fig.canvas.draw_idle()
+            elif ax is not None:
+                fig, axs = ax.figure, ax
+                if lod:
+                    X, Y, C = _downsample_to_axes(X, Y, C, axs, lod, lod_method)
+                mesh = axs.pcolormesh(X, Y, C, shading="flat")
+                axs.set_xlabel(xlabel)
+                axs.set_ylabel(ylabel)
+                cb = fig.colorbar(mesh, ax=axs)
+                cb.set_label(clabel)
             else:
-                raise NotImplementedError(f"Unable to plot on coordinate system {csys}")
-            fig = plt.figure()
-            axs = plt.subplot(111)
-            plt.pcolormesh(X, Y, C, shading="flat")
-            axs.set_xlabel(xlabel)
-            axs.set_ylabel(ylabel)
-            cb = plt.colorbar()
-            cb.set_label(clabel)
-            plt.show()
+                fig = plt.figure()
+                axs = plt.subplot(111)
+                if lod:
+                    X, Y, C = _downsample_to_axes(X, Y, C, axs, lod, lod_method)
+                plt.pcolormesh(X, Y, C, shading="flat")
+                axs.set_xlabel(xlabel)
+                axs.set_ylabel(ylabel)
+                cb = plt.colorbar()
+                cb.set_label(clabel)
+            if show:
+                plt.show()
             return fig, axs, cb
 
         elif len(dims) == 1:
-            if self._output.coordinate_system == "cartesian":
-                X, Y, xlabel, ylabel = self._get_1D_cartesian_plot_data(csys, dims, idx)
-            elif self._output.coordinate_system == "cylindrical":
-                X, Y, xlabel, ylabel = self._get_1D_cylindrical_plot_data(
-                    csys, dims, idx
-                )
-            elif self._output.coordinate_system == "spherical":
-                X, Y, xlabel, ylabel = self._get_1D_spherical_plot_data(csys, dims, idx)
+            X, Y, xlabel, ylabel = self._get_1D_plot_data(csys, dims, idx)
+            if artist is not None:
+                artist.set_data(X, Y)
+                fig, axs = artist.figure, artist.axes
+                axs.relim()
+                axs.autoscale_view()
+                fig.canvas.draw_idle()
+            elif ax is not None:
+                fig, axs = ax.figure, ax
+                axs.plot(X, Y)
+                axs.set_xlabel(xlabel)
+                axs.set_ylabel(ylabel)
             else:
-                raise NotImplementedError(f"Unable to plot on coordinate system {csys}")
-            fig = plt.figure()
-            axs = plt.subplot(111)
-            plt.plot(X, Y)
-            axs.set_xlabel(xlabel)
-            axs.set_ylabel(ylabel)
-            plt.show()
+                fig = plt.figure()
+                axs = plt.subplot(111)
+                plt.plot(X, Y)
+                axs.set_xlabel(xlabel)
+                axs.set_ylabel(ylabel)
+            if show:
+                plt.show()
             return fig, axs
 
     @property
@@ -342,42 +914,308 @@ class Field(ABC):
 
 
 class DerivedField:
-    """A derived field."""
-
-    def __new__(cls, base: Field) -> "DerivedField":
+    """A derived field.
+
+    A derived field is the result of an operation on one or more fields. The
+    operation is not performed until the field values are first accessed, at which
+    point the operations of any unevaluated derived fields it depends on are fused
+    into a single pass over the data, evaluated in blocks of BLOCK_SIZE values.
+    Chains of more than MAX_FUSED_DEPTH unevaluated derived fields are cut by
+    evaluating the deepest field, so that long chains, e.g. summing a field over
+    many output times, neither exhaust the stack nor keep every field alive.
+    """
+
+    _check_valid_for_arithmetic = Field._check_valid_for_arithmetic
+    _operand = Field._operand
+    _write = Field._write
+    __array_ufunc__ = Field.__array_ufunc__
+    __array_function__ = Field.__array_function__
+    __array__ = Field.__array__
+    __add__ = Field.__add__
+    __radd__ = Field.__radd__
+    __sub__ = Field.__sub__
+    __rsub__ = Field.__rsub__
+    __mul__ = Field.__mul__
+    __rmul__ = Field.__rmul__
+    __truediv__ = Field.__truediv__
+    __rtruediv__ = Field.__rtruediv__
+    __pow__ = Field.__pow__
+    __rpow__ = Field.__rpow__
+    add = Field.add
+    subtract = Field.subtract
+    multiply = Field.multiply
+    divide = Field.divide
+    power = Field.power
+    astype = Field.astype
+    centred = Field.centred
+    _get_2D_plot_data = Field._get_2D_plot_data
+    _get_1D_plot_data = Field._get_1D_plot_data
+    plot = Field.plot
+
+    def __new__(cls, base: Field, *args: Any) -> "DerivedField":
         """Define a new field, derived from another.
 
+        The field is an instance of the subclass of DerivedField for the class of
+        the base field, which plots the field in the same way as the base field.
+
         Args:
             base (Field): The field to derive from.
+            args (Any): The remaining arguments to __init__.
 
         Returns:
             DerivedField: A new field, derived from another.
         """
-        cls._get_2D_cartesian_plot_data = base.__class__._get_2D_cartesian_plot_data
-        cls._get_2D_cylindrical_plot_data = base.__class__._get_2D_cylindrical_plot_data
-        cls._get_2D_spherical_plot_data = base.__class__._get_2D_spherical_plot_data
-        cls._get_1D_cartesian_plot_data = base.__class__._get_1D_cartesian_plot_data
-        cls._get_1D_cylindrical_plot_data = base.__class__._get_1D_cylindrical_plot_data
-        cls._get_1D_spherical_plot_data = base.__class__._get_1D_spherical_plot_data
-        cls.x = base.__class__.x
-        cls.y = base.__class__.y
-        cls.z = base.__class__.z
-        cls.raw = base.__class__.raw
-        cls.data = base.__class__.data
-        cls.plot = Field.plot
-        return super().__new__(cls)
-
-    def __init__(self, base: Field) -> None:
+        return super().__new__(_derived_class(base.__class__))
+
+    def __init__(
+        self,
+        base: Field,
+        operation: Callable[..., NDArray[float64]],
+        operands: tuple[Any, ...],
+    ) -> None:
         """Create a derived field.
 
         Args:
             base (Field): The field to derive from.
+            operation (Callable): The operation deriving the field.
+            operands (tuple[Any, ...]): The fields and values operated on.
         """
         self.symbol = base.symbol
         self._output = base._output
         self._xdata = base._xdata
         self._ydata = base._ydata
         self._zdata = base._zdata
+        self._grid = base._grid
+        if hasattr(base, "_dimension"):
+            self._dimension = base._dimension
+        self._operation = operation
+        self._operands = operands
+        self._values: NDArray[float64] | None = None
+        self._lock = RLock()
+        self._dependents: WeakSet[DerivedField] = WeakSet()
+        self._register()
+        self._depth = 1 + max(map(_depth, operands), default=0)
+        if self._depth > MAX_FUSED_DEPTH:
+            for operand in operands:
+                if _depth(operand) == MAX_FUSED_DEPTH:
+                    operand._evaluate()
+            self._depth = 1 + max(map(_depth, operands), default=0)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state of the field to pickle, without its lock and dependents.
+
+        Returns:
+            dict[str, Any]: The attributes of the field, except its lock and
+                            dependents
+        """
+        with self._lock:
+            state = self.__dict__.copy()
+        del state["_lock"], state["_dependents"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of an unpickled field, with a new lock.
+
+        The field is registered with the unpickled derived fields it operates on,
+        which are restored first, as their dependent.
+
+        Args:
+            state (dict[str, Any]): The attributes of the field, except its lock
+                                    and dependents
+        """
+        self.__dict__.update(state)
+        self._lock = RLock()
+        self._dependents = WeakSet()
+        self._register()
+
+    def __reduce__(self) -> tuple[Callable[[type], "DerivedField"], tuple, dict]:
+        """Reduce the field for pickling.
+
+        The subclass of the field is created at run time, so cannot be pickled by
+        name, and is instead recreated from the class of the field derived from.
+
+        Returns:
+            tuple[Callable, tuple, dict]: The function creating the field from the
+                                          class of the field derived from, its
+                                          arguments, and the state of the field
+        """
+        return _new_derived, (self._base_class,), self.__getstate__()
+
+    def _register(self) -> None:
+        """Register the field as a dependent of the derived fields it operates on."""
+        for operand in self._operands:
+            if isinstance(operand, DerivedField):
+                with operand._lock:
+                    operand._dependents.add(self)
+
+    def _evaluate(self) -> NDArray[float64]:
+        """Evaluate the field values.
+
+        The values are stored in a single Fortran-ordered buffer, of which the raw
+        field values are a flattened view. The buffer is only stored once it has
+        been filled, and concurrent calls wait for the first to finish, so the
+        values can be evaluated from several threads.
+
+        Returns:
+            NDArray: A shaped numpy array containing the field values
+        """
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    operands = self._operands
+                    shape = self._shape()
+                    values = None
+                    for block in _blocks(shape):
+                        block_values = self._operation(
+                            *_block_operands(operands, block, {})
+                        )
+                        if values is None:
+                            values = empty(shape, dtype=block_values.dtype, order="F")
+                        values[block] = block_values
+                    self._values = values
+                    self._operands = ()
+        return self._values
+
+    def _fuse(
+        self, block: tuple[slice, ...], memo: dict[int, NDArray]
+    ) -> NDArray[float64]:
+        """Evaluate a block of the field values.
+
+        Any unevaluated derived fields operated on are evaluated for the block only,
+        and each only once, however many fields operate on it. The operands are read
+        before the values, as they are released only after the values are stored by
+        _evaluate, possibly in another thread.
+
+        Args:
+            block (tuple[slice, ...]): The block of the field values to evaluate.
+            memo (dict[int, NDArray]): The blocks of the derived fields already
+                                       evaluated for the block, by field id.
+
+        Returns:
+            NDArray: The block of field values
+        """
+        fused = memo.get(id(self))
+        if fused is None:
+            operands = self._operands
+            values = self._values
+            if values is not None:
+                fused = values[block]
+            else:
+                fused = self._operation(*_block_operands(operands, block, memo))
+            memo[id(self)] = fused
+        return fused
+
+    def _assign(
+        self,
+        operation: Callable[..., NDArray[float64]],
+        operands: tuple[Any, ...],
+    ) -> None:
+        """Overwrite the field values with the result of an operation, in place.
+
+        The operation is evaluated in blocks, each written straight into the field's
+        buffer, so no other buffer is allocated. The operands may include the field
+        itself, and derived fields depending on it that are yet to be evaluated are
+        evaluated with its values before the operation. The symbol is unchanged.
+
+        Args:
+            operation (Callable): A ufunc, called with the block of each operand.
+            operands (tuple[Any, ...]): The fields and values operated on.
+        """
+        with self._lock:
+            dependents = list(self._dependents)
+            self._dependents.clear()
+        for dependent in dependents:
+            dependent._evaluate()
+        _evaluate_into(self._evaluate(), operation, operands)
+
+    def __iadd__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Add a field, scalar or array to the field, in place.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be added.
+
+        Returns:
+            DerivedField: The field, holding the sum.
+        """
+        return self.add(other, out=self)
+
+    def __isub__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Subtract a field, scalar or array from the field, in place.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be subtracted.
+
+        Returns:
+            DerivedField: The field, holding the difference.
+        """
+        return self.subtract(other, out=self)
+
+    def __imul__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Multiply the field by a field, scalar or array, in place.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be multiplied by.
+
+        Returns:
+            DerivedField: The field, holding the product.
+        """
+        return self.multiply(other, out=self)
+
+    def __itruediv__(self, other: "Field | ArrayLike") -> "DerivedField":
+        """Divide the field by a field, scalar or array, in place.
+
+        Args:
+            other (Field | ArrayLike): The field, scalar or array to be divided by.
+
+        Returns:
+            DerivedField: The field, holding the ratio.
+        """
+        return self.divide(other, out=self)
+
+    def __ipow__(self, exponent: "Field | ArrayLike") -> "DerivedField":
+        """Raise the field data to a power, in place.
+
+        Args:
+            exponent (Field | ArrayLike): The power to raise the field to.
+
+        Returns:
+            DerivedField: The field, holding the data raised to the power.
+        """
+        return self.power(exponent, out=self)
+
+    def _shape(self) -> tuple[int, ...]:
+        """Get the shape of the field values.
+
+        Returns:
+            tuple[int, ...]: The shape of the field values
+        """
+        operands = self._operands
+        values = self._values
+        if values is not None:
+            return values.shape
+        for operand in operands:
+            if isinstance(operand, DerivedField):
+                return operand._shape()
+            elif isinstance(operand, Field):
+                return operand._data.shape
+
+    @property
+    def _raw(self) -> NDArray[float64]:
+        """The field values, evaluated on first access.
+
+        Returns:
+            NDArray: A 1D view of the field values
+        """
+        return reshape(self._evaluate(), -1, order="F")
+
+    @property
+    def _data(self) -> NDArray[float64]:
+        """The shaped field values, evaluated on first access.
+
+        Returns:
+            NDArray: A shaped numpy array containing the field values
+        """
+        return self._evaluate()
 
     def set_symbol(self, symbol: str) -> None:
         """Set the symbol representing the field's quantity.
@@ -386,3 +1224,288 @@ class DerivedField:
             symbol (str): The symbol to represent the quantity.
         """
         self.symbol = symbol
+
+
+def _depth(operand: Any) -> int:
+    """Get the length of the longest chain of unevaluated derived fields in an operand.
+
+    Args:
+        operand (Any): The field, scalar or array operated on
+
+    Returns:
+        int: The number of unevaluated derived fields chained, or 0 if the operand
+             is not an unevaluated derived field
+    """
+    if isinstance(operand, DerivedField) and operand._values is None:
+        return operand._depth
+    return 0
+
+
+def _derived_class(base_class: type) -> type:
+    """Get the subclass of DerivedField for fields derived from a class of field.
+
+    The subclass is created the first time a field is derived from the class, and
+    reused afterwards, so deriving a field does not modify any class.
+
+    Args:
+        base_class (type): The class of the field derived from
+
+    Returns:
+        type: The subclass of DerivedField
+    """
+    if issubclass(base_class, DerivedField):
+        return base_class
+    derived_class = _derived_classes.get(base_class)
+    if derived_class is None:
+        with _derived_classes_lock:
+            derived_class = _derived_classes.get(base_class)
+            if derived_class is None:
+                attributes = {
+                    name: getattr(base_class, name) for name in BASE_ATTRIBUTES
+                }
+                attributes["_base_class"] = base_class
+                derived_class = type(
+                    f"Derived{base_class.__name__}", (DerivedField,), attributes
+                )
+                _derived_classes[base_class] = derived_class
+    return derived_class
+
+
+def _new_derived(base_class: type) -> DerivedField:
+    """Create an uninitialised field derived from a class of field, for unpickling.
+
+    Args:
+        base_class (type): The class of the field derived from
+
+    Returns:
+        DerivedField: An instance of the subclass of DerivedField for the class
+    """
+    return object.__new__(_derived_class(base_class))
+
+
+def _symbol(operand: Any) -> str:
+    """Get the symbol representing an operand.
+
+    Args:
+        operand (Any): The field, scalar or array
+
+    Returns:
+        str: The symbol of a field, the value of a scalar, or an ellipsis for arrays
+    """
+    if isinstance(operand, Field | DerivedField):
+        return operand.symbol
+    if isinstance(operand, ndarray):
+        return r"\ldots"
+    if isinstance(operand, Real):
+        return f"{operand:g}"
+    return str(operand)
+
+
+class _UpperFaces:
+    """The values of a staggered field at the upper faces of its cells."""
+
+    def __init__(self, field: Field, axis: int, periodic: bool) -> None:
+        """Shift a staggered field by one cell.
+
+        Args:
+            field (Field): The field, defined at the lower faces of its cells
+            axis (int): The axis the field is staggered along
+            periodic (bool): Whether the axis is periodic
+        """
+        self._field = field
+        self._axis = axis
+        self._periodic = periodic
+
+    def __getitem__(self, block: tuple[slice, ...]) -> NDArray[float64]:
+        """Get a block of the values.
+
+        Only the block of the last cells along the axis is copied, to append the
+        values at their upper faces.
+
+        Args:
+            block (tuple[slice, ...]): The block of the field values
+
+        Returns:
+            NDArray: The values at the upper faces of the cells in the block
+        """
+        data = self._field._data
+        n = data.shape[self._axis]
+        start, stop, _ = block[self._axis].indices(n)
+        upper = list(block)
+        upper[self._axis] = slice(start + 1, stop + 1)
+        values = data[tuple(upper)]
+        if stop == n:
+            edge = list(block)
+            edge[self._axis] = slice(0, 1) if self._periodic else slice(n - 1, n)
+            values = concatenate((values, data[tuple(edge)]), axis=self._axis)
+        return values
+
+
+def _midpoint(
+    lower: NDArray[float64], upper: NDArray[float64], out: NDArray | None = None
+) -> NDArray[float64]:
+    """Get the mean of the values at the lower and upper faces of cells.
+
+    Args:
+        lower (NDArray): The values at the lower faces
+        upper (NDArray): The values at the upper faces
+        out (NDArray | None): The array to write the means into, or None to
+                              allocate one
+
+    Returns:
+        NDArray: The means
+    """
+    out = add(lower, upper, out=out)
+    return multiply(out, 0.5, out=out)
+
+
+def _evaluate_into(
+    values: NDArray,
+    operation: Callable[..., NDArray[float64]],
+    operands: tuple[Any, ...],
+) -> None:
+    """Evaluate an operation on the operands of a derived field into an array.
+
+    The operation is evaluated in blocks, each written straight into the array.
+
+    Args:
+        values (NDArray): The array to write into, of the shape of the field data
+        operation (Callable): The operation, a ufunc accepting an out argument
+        operands (tuple[Any, ...]): The fields and values operated on
+    """
+    for block in _blocks(values.shape):
+        operation(*_block_operands(operands, block, {}), out=values[block])
+
+
+def _unwrap(value: Any) -> Any:
+    """Replace fields with their values, e.g. in the arguments of numpy functions.
+
+    Args:
+        value (Any): A field, or a list, tuple or dict which may contain fields
+
+    Returns:
+        Any: The value, with the shaped values of any fields in place of the fields
+    """
+    if isinstance(value, Field | DerivedField):
+        return value._data
+    if isinstance(value, list | tuple):
+        return type(value)(_unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _ufunc_symbol(function: ufunc, operands: tuple[Any, ...]) -> str:
+    """Get the symbol representing the result of a ufunc.
+
+    Args:
+        function (ufunc): The ufunc
+        operands (tuple[Any, ...]): The fields, scalars and arrays operated on
+
+    Returns:
+        str: The symbol of the arithmetic expression, or of the ufunc applied to the
+             symbols of the operands
+    """
+    symbols = [_symbol(operand) for operand in operands]
+    if function in OPERATOR_SYMBOLS:
+        return OPERATOR_SYMBOLS[function].format(*symbols)
+    return rf"\mathrm{{{function.__name__}}}\left({', '.join(symbols)}\right)"
+
+
+def _block_operands(
+    operands: tuple[Any, ...], block: tuple[slice, ...], memo: dict[int, NDArray]
+) -> list:
+    """Get the part of each operand of a derived field which operates on a block.
+
+    Any unevaluated derived fields are evaluated for the block only, and those
+    shared by several fields are evaluated once, so an expression is evaluated as
+    a graph rather than a tree, e.g. in a chain of x = x + x.
+
+    Args:
+        operands (tuple[Any, ...]): The fields and values operated on
+        block (tuple[slice, ...]): The block of the field values
+        memo (dict[int, NDArray]): The blocks of the derived fields already
+                                   evaluated for the block, by field id
+
+    Returns:
+        list: The blocks of the fields and arrays, and the scalars
+    """
+    args = []
+    for operand in operands:
+        if isinstance(operand, DerivedField):
+            args.append(operand._fuse(block, memo))
+        elif isinstance(operand, Field):
+            args.append(operand._data[block])
+        elif isinstance(operand, _UpperFaces):
+            args.append(operand[block])
+        elif isinstance(operand, ndarray):
+            args.append(operand[_broadcast_block(block, operand.shape)])
+        else:
+            args.append(operand)
+    return args
+
+
+def _broadcast_block(
+    block: tuple[slice, ...], shape: tuple[int, ...]
+) -> tuple[slice, ...]:
+    """Get the part of a broadcasting array which operates on a block of a field.
+
+    Args:
+        block (tuple[slice, ...]): The block of the field values
+        shape (tuple[int, ...]): The shape of the array, with an extent of 1 in the
+                                 dimensions it is broadcast along
+
+    Returns:
+        tuple[slice, ...]: The part of the array operating on the block
+    """
+    return tuple(
+        part if n > 1 else slice(None) for part, n in zip(block, shape, strict=True)
+    )
+
+
+def _downsample_to_axes(
+    X: NDArray[float64],
+    Y: NDArray[float64],
+    C: NDArray[float64],
+    axs: Axes,
+    lod: bool | int,
+    method: str,
+) -> tuple[NDArray[float64], NDArray[float64], NDArray[float64]]:
+    """Downsample a 2D slice of a field for plotting on a set of axes.
+
+    Args:
+        X (NDArray): The x-coordinates of the cell edges
+        Y (NDArray): The y-coordinates of the cell edges
+        C (NDArray): The field values
+        axs (Axes): The axes to plot on
+        lod (bool | int): True to downsample to the resolution of the axes, or the
+                          maximum number of cells in each dimension
+        method (str): How blocks of cells are combined, either "mean", "min" or
+                      "max"
+
+    Returns:
+        tuple[NDArray, NDArray, NDArray]: The downsampled x- and y-coordinates of
+                                          the cell edges, and field values
+    """
+    n = resolution(axs) if lod is True else lod
+    return downsample(X, Y, C, (n, n), method)
+
+
+def _blocks(shape: tuple[int, ...]) -> Iterator[tuple[slice, ...]]:
+    """Split an array into contiguous blocks of about BLOCK_SIZE values.
+
+    The array is assumed to be in Fortran order, so it is split along its last
+    dimension with more than one value.
+
+    Args:
+        shape (tuple[int, ...]): The shape of the array.
+
+    Yields:
+        tuple[slice, ...]: The index of each block in the array.
+    """
+    axis = max((i for i, n in enumerate(shape) if n > 1), default=0)
+    step = max(1, BLOCK_SIZE // prod(shape[:axis]))
+    for start in range(0, shape[axis], step):
+        block = [slice(None)] * len(shape)
+        block[axis] = slice(start, start + step)
+        yield tuple(block)
@@ -1,7 +1,7 @@
 """A density field handler."""
 
 from matplotlib.pyplot import axis, colorbar, figure
-from numpy import cos, float64, fromfile, meshgrid, sin
+from numpy import float64
 from numpy.typing import NDArray
 
 from fargonaut.field import Field
@@ -19,15 +19,17 @@ class Density(Field):
         data: The field density data mapped to the coordinates
     """
 
-    def __init__(self, output, num: int) -> None:
+    def __init__(self, output, num: int, mmap: bool = False) -> None:
         """Read a density field.
 
         Args:
             output: The FARGO3D simulation output
             num (int): The number of the field output time to load
+            mmap (bool): Whether to memory-map the field data file
         """
         self.symbol = r"\mathit{\Sigma}_\mathrm{g}"
         self._output = output
+        self._mmap = mmap
         self._raw = self._load(num)
         self._process_domains()
         self._process_data()
@@ -41,20 +43,12 @@ class Density(Field):
         Returns:
             NDArray: The density field data
         """
-        return fromfile(f"{self._output._directory / 'gasdens'}{num}{'.dat'}")
+        return self._read(f"{self._output._directory / 'gasdens'}{num}{'.dat'}")
 
     def _process_domains(self) -> None:
         """Generate the coordinates at which the field data are defined."""
-        self._xdata = 0.5 * (self._output._xdomain[:-1] + self._output._xdomain[1:])
-        self._ydata = 0.5 * (self._output._ydomain[:-1] + self._output._ydomain[1:])
-        self._zdata = 0.5 * (self._output._zdomain[:-1] + self._output._zdomain[1:])
-
-        if self._output.nghx:
-            self._xdata = self._xdata[self._output.nghx : -self._output.nghx]
-        if self._output.nghy:
-            self._ydata = self._ydata[self._output.nghy : -self._output.nghy]
-        if self._output.nghz:
-            self._zdata = self._zdata[self._output.nghz : -self._output.nghz]
+        self._xdata, self._ydata, self._zdata = self._output.grids.coordinates()
+        self._grid = (self._output.grids, None)
 
     def _get_2D_cartesian_plot_data(
         self, csys: str, dims: str, idx: int
@@ -71,46 +65,15 @@ class Density(Field):
             axis: The axes containing the plot
             colorbar: The colorbar for the field
         """
-        xdata = self._output._xdomain
-        ydata = self._output._ydomain
-        zdata = self._output._zdomain
-
-        if self._output.nghx:
-            xdata = xdata[self._output.nghx : -self._output.nghx]
-        if self._output.nghy:
-            ydata = ydata[self._output.nghy : -self._output.nghy]
-        if self._output.nghz:
-            zdata = zdata[self._output.nghz : -self._output.nghz]
-
-        xgrid, ygrid, zgrid = meshgrid(xdata, ydata, zdata, indexing="ij")
-
-        if csys == "polar":
-            raise NotImplementedError
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [xgrid, "$x$"],
-                "y": [ygrid, "$y$"],
-                "z": [zgrid, "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims[0]][0]
-        ygrid = coord_map[dims[1]][0]
-        xlabel = coord_map[dims[0]][1]
-        ylabel = coord_map[dims[1]][1]
+        coord_map = self._output.grids.plane("cartesian", csys, dims, idx)
+        X, xlabel = coord_map[dims[0]]
+        Y, ylabel = coord_map[dims[1]]
 
         if dims == "xy":
-            X = xgrid[:, :, idx]
-            Y = ygrid[:, :, idx]
             C = self._data[:, :, idx]
         elif dims == "xz":
-            X = xgrid[:, idx, :]
-            Y = ygrid[:, idx, :]
             C = self._data[:, idx, :]
         elif dims == "yz":
-            X = xgrid[idx, :, :]
-            Y = ygrid[idx, :, :]
             C = self._data[idx, :, :]
 
         return X, Y, C, xlabel, ylabel, f"${self.symbol}$"
@@ -130,50 +93,15 @@ class Density(Field):
             axis: The axes containing the plot
             colorbar: The colorbar for the field
         """
-        phidata = self._output._xdomain
-        rdata = self._output._ydomain
-        zdata = self._output._zdomain
-
-        if self._output.nghx:
-            phidata = phidata[self._output.nghx : -self._output.nghx]
-        if self._output.nghy:
-            rdata = rdata[self._output.nghy : -self._output.nghy]
-        if self._output.nghz:
-            zdata = zdata[self._output.nghz : -self._output.nghz]
-
-        phigrid, rgrid, zgrid = meshgrid(phidata, rdata, zdata, indexing="ij")
-
-        if csys == "polar":
-            coord_map = {
-                "x": [phigrid, r"$\phi$"],
-                "y": [rgrid, "$r$"],
-                "z": [zgrid, "$z$"],
-            }
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [rgrid * cos(phigrid), "$x$"],
-                "y": [rgrid * sin(phigrid), "$y$"],
-                "z": [zgrid, "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims[0]][0]
-        ygrid = coord_map[dims[1]][0]
-        xlabel = coord_map[dims[0]][1]
-        ylabel = coord_map[dims[1]][1]
+        coord_map = self._output.grids.plane("cylindrical", csys, dims, idx)
+        X, xlabel = coord_map[dims[0]]
+        Y, ylabel = coord_map[dims[1]]
 
         if dims == "xy":
-            X = xgrid[:, :, idx]
-            Y = ygrid[:, :, idx]
             C = self._data[:, :, idx]
         elif dims == "xz":
-            X = xgrid[:, idx, :]
-            Y = ygrid[:, idx, :]
             C = self._data[:, idx, :]
         elif dims == "yz":
-            X = xgrid[idx, :, :]
-            Y = ygrid[idx, :, :]
             C = self._data[idx, :, :]
 
         return X, Y, C, xlabel, ylabel, f"${self.symbol}$"
@@ -193,50 +121,15 @@ class Density(Field):
             axis: The axes containing the plot
             colorbar: The colorbar for the field
         """
-        phidata = self._output._xdomain
-        rdata = self._output._ydomain
-        thetadata = self._output._zdomain
-
-        if self._output.nghx:
-            phidata = phidata[self._output.nghx : -self._output.nghx]
-        if self._output.nghy:
-            rdata = rdata[self._output.nghy : -self._output.nghy]
-        if self._output.nghz:
-            thetadata = thetadata[self._output.nghz : -self._output.nghz]
-
-        phigrid, rgrid, thetagrid = meshgrid(phidata, rdata, thetadata, indexing="ij")
-
-        if csys == "polar":
-            coord_map = {
-                "x": [phigrid, r"$\phi$"],
-                "y": [rgrid, "$r$"],
-                "z": [thetagrid, r"$\theta$"],
-            }
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [rgrid * cos(phigrid) * sin(thetagrid), "$x$"],
-                "y": [rgrid * sin(phigrid) * sin(thetagrid), "$y$"],
-                "z": [rgrid * cos(thetagrid), "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims[0]][0]
-        ygrid = coord_map[dims[1]][0]
-        xlabel = coord_map[dims[0]][1]
-        ylabel = coord_map[dims[1]][1]
+        coord_map = self._output.grids.plane("spherical", csys, dims, idx)
+        X, xlabel = coord_map[dims[0]]
+        Y, ylabel = coord_map[dims[1]]
 
         if dims == "xy":
-            X = xgrid[:, :, idx]
-            Y = ygrid[:, :, idx]
             C = self._data[:, :, idx]
         elif dims == "xz":
-            X = xgrid[:, idx, :]
-            Y = ygrid[:, idx, :]
             C = self._data[:, idx, :]
         elif dims == "yz":
-            X = xgrid[idx, :, :]
-            Y = ygrid[idx, :, :]
             C = self._data[idx, :, :]
 
         return X, Y, C, xlabel, ylabel, f"${self.symbol}$"
@@ -255,34 +148,14 @@ class Density(Field):
             figure: The figure containing the plot
             axis: The axes containing the plot
         """
-        xdata = self._xdata
-        ydata = self._ydata
-        zdata = self._zdata
-
-        xgrid, ygrid, zgrid = meshgrid(xdata, ydata, zdata, indexing="ij")
-
-        if csys == "polar":
-            raise NotImplementedError
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [xgrid, "$x$"],
-                "y": [ygrid, "$y$"],
-                "z": [zgrid, "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims][0]
-        xlabel = coord_map[dims][1]
+        coord_map = self._output.grids.line("cartesian", None, csys, dims, idx)
+        X, xlabel = coord_map[dims]
 
         if dims == "x":
-            X = xgrid[:, idx[0], idx[1]]
             Y = self._data[:, idx[0], idx[1]]
         elif dims == "y":
-            X = xgrid[idx[0], :, idx[1]]
             Y = self._data[idx[0], :, idx[1]]
         elif dims == "z":
-            X = xgrid[idx[0], idx[1], :]
             Y = self._data[idx[0], idx[1], :]
 
         return X, Y, xlabel, f"${self.symbol}$"
@@ -301,38 +174,14 @@ class Density(Field):
             figure: The figure containing the plot
             axis: The axes containing the plot
         """
-        phidata = self._xdata
-        rdata = self._ydata
-        zdata = self._zdata
-
-        phigrid, rgrid, zgrid = meshgrid(phidata, rdata, zdata, indexing="ij")
-
-        if csys == "polar":
-            coord_map = {
-                "x": [phigrid, r"$\phi$"],
-                "y": [rgrid, "$r$"],
-                "z": [zgrid, "$z$"],
-            }
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [rgrid * cos(phigrid), "$x$"],
-                "y": [rgrid * sin(phigrid), "$y$"],
-                "z": [zgrid, "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims][0]
-        xlabel = coord_map[dims][1]
+        coord_map = self._output.grids.line("cylindrical", None, csys, dims, idx)
+        X, xlabel = coord_map[dims]
 
         if dims == "x":
-            X = xgrid[:, idx[0], idx[1]]
             Y = self._data[:, idx[0], idx[1]]
         elif dims == "y":
-            X = xgrid[idx[0], :, idx[1]]
             Y = self._data[idx[0], :, idx[1]]
         elif dims == "z":
-            X = xgrid[idx[0], idx[1], :]
             Y = self._data[idx[0], idx[1], :]
 
         return X, Y, xlabel, f"${self.symbol}$"
@@ -351,38 +200,14 @@ class Density(Field):
             figure: The figure containing the plot
             axis: The axes containing the plot
         """
-        phidata = self._xdata
-        rdata = self._ydata
-        thetadata = self._zdata
-
-        phigrid, rgrid, thetagrid = meshgrid(phidata, rdata, thetadata, indexing="ij")
-
-        if csys == "polar":
-            coord_map = {
-                "x": [phigrid, r"$\phi$"],
-                "y": [rgrid, "$r$"],
-                "z": [thetagrid, r"$\theta$"],
-            }
-        elif csys == "cartesian":
-            coord_map = {
-                "x": [rgrid * cos(phigrid) * sin(thetagrid), "$x$"],
-                "y": [rgrid * sin(phigrid) * sin(thetagrid), "$y$"],
-                "z": [rgrid * cos(thetagrid), "$z$"],
-            }
-        else:
-            raise ValueError(f"Unknown coordinate system {csys}")
-
-        xgrid = coord_map[dims][0]
-        xlabel = coord_map[dims][1]
+        coord_map = self._output.grids.line("spherical", None, csys, dims, idx)
+        X, xlabel = coord_map[dims]
 
         if dims == "x":
-            X = xgrid[:, idx[0], idx[1]]
             Y = self._data[:, idx[0], idx[1]]
         elif dims == "y":
-            X = xgrid[idx[0], :, idx[1]]
             Y = self._data[idx[0], :, idx[1]]
         elif dims == "z":
-            X = xgrid[idx[0], idx[1], :]
             Y = self._data[idx[0], idx[1], :]
 
         return X, Y, xlabel, f"${self.symbol}$"
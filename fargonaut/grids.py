@@ -0,0 +1,259 @@
+"""A registry of the coordinate grids of a FARGO3D simulation output."""
+
+from numpy import cos, float64, meshgrid, sin
+from numpy.typing import NDArray
+
+from fargonaut.cache import Cache
+
+CoordMap = dict[str, tuple[NDArray[float64], str]]
+
+
+class Grids:
+    """The coordinate grids of an output, computed once and shared between fields.
+
+    Grids depend only on the domain of the output, so they are memoised and may be
+    reused by every field and output time. The arrays returned are read-only.
+
+    Attributes:
+        cache: The cache of plane and line grids
+    """
+
+    def __init__(self, output, max_bytes: int = 256 * 1024**2) -> None:
+        """Create an empty grid registry.
+
+        Args:
+            output: The FARGO3D simulation output
+            max_bytes (int): The maximum total size of the cached plane and line
+                             grids
+        """
+        self._output = output
+        self._coordinates: dict[str | None, tuple[NDArray[float64], ...]] = {}
+        self._edges: tuple[NDArray[float64], ...] | None = None
+        self._cache = Cache(max_bytes)
+
+    def coordinates(
+        self, staggering: str | None = None
+    ) -> tuple[NDArray[float64], NDArray[float64], NDArray[float64]]:
+        """Get the coordinates at which field data are defined.
+
+        Field data are defined at cell centres, except in the dimension a field is
+        staggered along, where they are defined at the lower cell faces.
+
+        Args:
+            staggering (str | None): The dimension the field is staggered along
+
+        Returns:
+            tuple[NDArray, NDArray, NDArray]: The x-, y- and z-coordinates
+        """
+        if staggering not in self._coordinates:
+            coordinates = []
+            for dim in "xyz":
+                domain = getattr(self._output, f"_{dim}domain")
+                if dim == staggering:
+                    data = domain[:-1]
+                else:
+                    data = 0.5 * (domain[:-1] + domain[1:])
+                ngh = getattr(self._output, f"ngh{dim}")
+                if ngh:
+                    data = data[ngh:-ngh]
+                coordinates.append(_read_only(data))
+            self._coordinates[staggering] = tuple(coordinates)
+        return self._coordinates[staggering]
+
+    def edges(self) -> tuple[NDArray[float64], NDArray[float64], NDArray[float64]]:
+        """Get the coordinates of the cell edges, excluding ghost cells.
+
+        Returns:
+            tuple[NDArray, NDArray, NDArray]: The x-, y- and z-coordinates
+        """
+        if self._edges is None:
+            edges = []
+            for dim in "xyz":
+                data = getattr(self._output, f"_{dim}domain")
+                ngh = getattr(self._output, f"ngh{dim}")
+                if ngh:
+                    data = data[ngh:-ngh]
+                edges.append(_read_only(data))
+            self._edges = tuple(edges)
+        return self._edges
+
+    def plane(self, system: str, csys: str, dims: str, idx: int) -> CoordMap:
+        """Get the grids of cell edges on a 2D slice of the domain.
+
+        Args:
+            system (str): The coordinate system of the simulation
+            csys (str): The coordinate system to project the grids onto
+            dims (str): The dimensions of the slice
+            idx (int): The index of the slice in the third dimension
+
+        Returns:
+            CoordMap: The grid and label of each dimension
+
+        Raises:
+            ValueError: If the slice dimensions are unknown
+        """
+        if dims == "xy":
+            sliced = {"z": idx}
+        elif dims == "xz":
+            sliced = {"y": idx}
+        elif dims == "yz":
+            sliced = {"x": idx}
+        else:
+            raise ValueError(f"Unknown slice dimensions {dims}")
+        return self._grids(
+            ("plane", system, csys, dims, idx), None, system, csys, sliced
+        )
+
+    def line(
+        self,
+        system: str,
+        staggering: str | None,
+        csys: str,
+        dims: str,
+        idx: tuple[int, int],
+    ) -> CoordMap:
+        """Get the grids of field coordinates on a 1D slice of the domain.
+
+        Args:
+            system (str): The coordinate system of the simulation
+            staggering (str | None): The dimension the field is staggered along
+            csys (str): The coordinate system to project the grids onto
+            dims (str): The dimension of the slice
+            idx (tuple[int, int]): The indices of the slice in the other dimensions
+
+        Returns:
+            CoordMap: The grid and label of each dimension
+
+        Raises:
+            ValueError: If the slice dimension is unknown
+        """
+        if dims == "x":
+            sliced = {"y": idx[0], "z": idx[1]}
+        elif dims == "y":
+            sliced = {"x": idx[0], "z": idx[1]}
+        elif dims == "z":
+            sliced = {"x": idx[0], "y": idx[1]}
+        else:
+            raise ValueError(f"Unknown slice dimension {dims}")
+        key = ("line", system, staggering, csys, dims, idx)
+        return self._grids(key, staggering, system, csys, sliced)
+
+    def _grids(
+        self,
+        key: tuple,
+        staggering: str | None,
+        system: str,
+        csys: str,
+        sliced: dict[str, int],
+    ) -> CoordMap:
+        """Get the projected grids on a slice of the domain, computing them once.
+
+        Plane grids are defined on the cell edges, and line grids on the field
+        coordinates.
+
+        Args:
+            key (tuple): The key of the grids in the cache
+            staggering (str | None): The dimension the field is staggered along
+            system (str): The coordinate system of the simulation
+            csys (str): The coordinate system to project the grids onto
+            sliced (dict[str, int]): The index of each sliced dimension
+
+        Returns:
+            CoordMap: The grid and label of each dimension
+        """
+        coord_map = self._cache.get(key)
+        if coord_map is None:
+            if key[0] == "plane":
+                data = self.edges()
+            else:
+                data = self.coordinates(staggering)
+            data = [
+                data[i][[sliced[dim]]] if dim in sliced else data[i]
+                for i, dim in enumerate("xyz")
+            ]
+            grid_idx = tuple(0 if dim in sliced else slice(None) for dim in "xyz")
+            grids = [grid[grid_idx] for grid in meshgrid(*data, indexing="ij")]
+            coord_map = {
+                dim: (_read_only(grid), label)
+                for dim, (grid, label) in _project(system, csys, *grids).items()
+            }
+            nbytes = sum(grid.nbytes for grid, _ in coord_map.values())
+            self._cache.put(key, coord_map, nbytes)
+        return coord_map
+
+    @property
+    def cache(self) -> Cache:
+        """The cache of plane and line grids.
+
+        Returns:
+            Cache: The cache of plane and line grids
+        """
+        return self._cache
+
+
+def _project(
+    system: str,
+    csys: str,
+    xgrid: NDArray[float64],
+    ygrid: NDArray[float64],
+    zgrid: NDArray[float64],
+) -> CoordMap:
+    """Project coordinate grids onto a coordinate system.
+
+    Args:
+        system (str): The coordinate system of the grids
+        csys (str): The coordinate system to project the grids onto
+        xgrid (NDArray): The grid of x-coordinates
+        ygrid (NDArray): The grid of y-coordinates
+        zgrid (NDArray): The grid of z-coordinates
+
+    Returns:
+        CoordMap: The projected grid and label of each dimension
+
+    Raises:
+        NotImplementedError: If a cartesian grid is projected onto polar coordinates
+        ValueError: If either coordinate system is unknown
+    """
+    if csys not in ("polar", "cartesian"):
+        raise ValueError(f"Unknown coordinate system {csys}")
+    if system == "cartesian":
+        if csys == "polar":
+            raise NotImplementedError
+        return {"x": (xgrid, "$x$"), "y": (ygrid, "$y$"), "z": (zgrid, "$z$")}
+    elif system == "cylindrical":
+        phigrid, rgrid = xgrid, ygrid
+        if csys == "polar":
+            return {"x": (phigrid, r"$\phi$"), "y": (rgrid, "$r$"), "z": (zgrid, "$z$")}
+        return {
+            "x": (rgrid * cos(phigrid), "$x$"),
+            "y": (rgrid * sin(phigrid), "$y$"),
+            "z": (zgrid, "$z$"),
+        }
+    elif system == "spherical":
+        phigrid, rgrid, thetagrid = xgrid, ygrid, zgrid
+        if csys == "polar":
+            return {
+                "x": (phigrid, r"$\phi$"),
+                "y": (rgrid, "$r$"),
+                "z": (thetagrid, r"$\theta$"),
+            }
+        return {
+            "x": (rgrid * cos(phigrid) * sin(thetagrid), "$x$"),
+            "y": (rgrid * sin(phigrid) * sin(thetagrid), "$y$"),
+            "z": (rgrid * cos(thetagrid), "$z$"),
+        }
+    raise ValueError(f"Unknown coordinate system {system}")
+
+
+def _read_only(data: NDArray[float64]) -> NDArray[float64]:
+    """Get a read-only view of an array, so that it can be shared safely.
+
+    Args:
+        data (NDArray): The array
+
+    Returns:
+        NDArray: A read-only view of the array
+    """
+    view = data.view()
+    view.flags.writeable = False
+    return view
@@ -1,84 +1,174 @@
 """A FARGO3D simulation output reader."""
 
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import FileIO
+from itertools import pairwise
+from os import cpu_count, getpid, replace, scandir
 from pathlib import Path
+from typing import Any
 
-from numpy import array, float64
+from numpy import (
+    array,
+    concatenate,
+    dtype,
+    empty,
+    float32,
+    float64,
+    fromfile,
+    int64,
+    memmap,
+    reshape,
+    split,
+    zeros,
+)
 from numpy.typing import NDArray
 
+from fargonaut.cache import Cache
 from fargonaut.field import Field
 from fargonaut.fields.density import Density
 from fargonaut.fields.energy import Energy
 from fargonaut.fields.magnetic_field import MagneticField
 from fargonaut.fields.velocity import Velocity
+from fargonaut.grids import Grids
+from fargonaut.prefetch import Prefetcher
+from fargonaut.render import FrameRenderer
+
+# The name of the binary cache of the domains, stored in the output directory
+DOMAINS_CACHE_FILE_NAME = ".domains.fargonaut"
+
+FIELD_NAMES = ("gasdens", "gasenergy", "bx", "by", "bz", "gasvx", "gasvy", "gasvz")
+
+# Matches field data files, including those written by each MPI process
+SNAPSHOT_PATTERN = re.compile(rf"^({'|'.join(FIELD_NAMES)})(\d+)(?:_\d+)?\.dat$")
 
 
 class Output:
     """A FARGO3D simulation output.
 
     Attributes:
+        cache: The cache of loaded fields, if caching is enabled
         directory: The path to the directory containing the output files
         domain_x: The x domain over which the output data are defined
         domain_y: The y domain over which the output data are defined
         domain_z: The z domain over which the output data are defined
+        grids: The coordinate grids of the output, shared between its fields
+        inventory: The field data files in the output directory
         nghx: The number of ghost cells in the x dimension
         nghy: The number of ghost cells in the y dimension
         nghz: The number of ghost cells in the z dimension
         opts: The options used in the simulation
+        prefetcher: The prefetcher of fields, if prefetching is enabled
         vars: The variables defined for the simulation
     """
 
     def __init__(self, directory: str) -> None:
-        """Read a FARGO3D output.
+        """Open a FARGO3D output.
+
+        No files are read until the output's metadata or data are used.
 
         Args:
             directory (str): The path to the directory containing the output
                              files
         """
         self._directory = Path(directory)
-        self._read_opts()
-        self._read_vars()
-        self._read_domains()
+        self._cache = None
+        self._prefetcher = None
+        self._grids = Grids(self)
+        self._subdomains: dict[int, tuple[int, int, int, int]] | None = None
+        self._inventory: dict[str, dict[int, tuple[int, int]]] | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Read the output's metadata the first time it is used.
+
+        The options, variables and domains are each read from their files when one
+        of them is first accessed, so that opening an output reads no files.
+
+        Args:
+            name (str): The name of the attribute
+
+        Returns:
+            Any: The value of the attribute
+
+        Raises:
+            AttributeError: If the attribute is not output metadata
+        """
+        if name == "_opts":
+            self._read_opts()
+        elif name == "_vars":
+            self._read_vars()
+        elif name in ("_xdomain", "_ydomain", "_zdomain"):
+            self._read_domains()
+        else:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return self.__dict__[name]
+
+    @classmethod
+    def peek(cls, directory: str) -> "Output":
+        """Open a FARGO3D output, reading only its variables file.
+
+        This checks that the directory contains an output and gives access to its
+        variables, such as its coordinate system and resolution, at the cost of a
+        single small read, e.g. when indexing many outputs.
+
+        Args:
+            directory (str): The path to the directory containing the output
+                             files
+
+        Returns:
+            Output: The output
+
+        Raises:
+            FileNotFoundError: If the directory does not contain a variables file
+        """
+        output = cls(directory)
+        output._read_vars()
+        return output
 
     def _read_domains(self) -> None:
-        """Read and store the contents of the output's dimensions files."""
-        fid = open(f"{self._directory / 'domain_x.dat'}")
-        xdata = fid.read().split("\n")
-        fid.close()
-        xdata.pop()
-        self._xdomain = array([float(i) for i in xdata])
-
-        fid = open(f"{self._directory / 'domain_y.dat'}")
-        ydata = fid.read().split("\n")
-        fid.close()
-        ydata.pop()
-        self._ydomain = array([float(i) for i in ydata])
-
-        fid = open(f"{self._directory / 'domain_z.dat'}")
-        zdata = fid.read().split("\n")
-        fid.close()
-        zdata.pop()
-        self._zdomain = array([float(i) for i in zdata])
+        """Read and store the contents of the output's dimensions files.
+
+        The domains are parsed once, then stored in a binary cache file in the
+        output directory, which is read instead for as long as the dimensions files
+        are unchanged.
+        """
+        filenames = [self._directory / f"domain_{dim}.dat" for dim in "xyz"]
+        stats = [filename.stat() for filename in filenames]
+        header = [stat.st_mtime_ns for stat in stats] + [stat.st_size for stat in stats]
+        cache_filename = self._directory / DOMAINS_CACHE_FILE_NAME
+        domains = _read_domains_cache(cache_filename, header)
+        if domains is None:
+            domains = [fromfile(filename, sep=" ") for filename in filenames]
+            _write_domains_cache(cache_filename, header, domains)
+        self._xdomain, self._ydomain, self._zdomain = domains
 
     def _read_opts(self) -> None:
-        """Read and store the options from the output's summary0 file."""
-        fid = open(f"{self._directory / 'summary0.dat'}")
-        line = fid.readline()
-        target = "COMPILATION OPTION SECTION:\n"
-        while not line == target:
+        """Read and store the options from the output's summary0 file.
+
+        Raises:
+            ValueError: If the summary0 file has no compilation option section
+        """
+        with open(f"{self._directory / 'summary0.dat'}") as fid:
+            line = fid.readline()
+            target = "COMPILATION OPTION SECTION:\n"
+            while not line == target:
+                if not line:
+                    raise ValueError(f"No compilation option section in {fid.name}")
+                line = fid.readline()
             line = fid.readline()
-        line = fid.readline()
-        opts = fid.readline().split()
-        fid.close()
+            opts = fid.readline().split()
         self._opts = tuple(opt.lstrip("-D") for opt in opts)
 
     def _read_vars(self) -> None:
         """Read and store the contents of the output's variables file."""
-        fid = open(f"{self._directory / 'variables.par'}")
         variables = {}
-        for line in fid:
-            (key, val) = line.split()
-            variables[key] = val
-        fid.close()
+        with open(self._directory / "variables.par") as fid:
+            for line in fid:
+                (key, val) = line.split()
+                variables[key] = val
         self._vars = variables
 
     def _read_units(self) -> None:
@@ -107,12 +197,84 @@ class Output:
         """
         return opt_name in self._opts
 
-    def get_field(self, name: str, num: int) -> Field:
+    def enable_cache(self, max_bytes: int) -> None:
+        """Cache loaded fields, so that repeated requests do not reread them.
+
+        Fields are cached by name and output number. The least recently used
+        fields are evicted once the total size of the cached field data would
+        exceed max_bytes.
+
+        Args:
+            max_bytes (int): The maximum total size of the cached field data
+        """
+        self._cache = Cache(max_bytes)
+
+    def disable_cache(self) -> None:
+        """Stop caching loaded fields, releasing any cached fields."""
+        self._cache = None
+
+    def enable_prefetch(self, depth: int = 2, workers: int | None = None) -> None:
+        """Load the fields at upcoming output times in the background.
+
+        Whenever a field is requested, the same field at the next depth output times
+        is loaded in background threads, so that stepping through the output times
+        in order overlaps reading each field with processing the previous one.
+        Memory-mapped fields are not prefetched.
+
+        Args:
+            depth (int): The number of output times to load ahead
+            workers (int | None): The number of threads, or None to use one per
+                                  output time loaded ahead
+        """
+        self.disable_prefetch()
+        self._prefetcher = Prefetcher(self, depth, workers)
+
+    def disable_prefetch(self) -> None:
+        """Stop prefetching fields, cancelling any prefetches in progress."""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+            self._prefetcher = None
+
+    def get_field(self, name: str, num: int, mmap: bool = False) -> Field:
         """Load the field at a given output time.
 
+        If mmap is set, the field data file is memory-mapped rather than read into
+        memory, so only the parts of the field that are used are loaded from disk.
+        If caching is enabled, a cached field is returned whether or not it was
+        memory-mapped. If prefetching is enabled, the field may already have been
+        loaded in the background.
+
         Args:
             name (str): The name of the field to get
             num (str): The number of the field output time to get
+            mmap (bool): Whether to memory-map the field data file
+
+        Returns:
+            Field: The field
+
+        Raises:
+            NotImplementedError: An invalid field was requested
+        """
+        field = None if self._cache is None else self._cache.get((name, num))
+        prefetcher = None if mmap else self._prefetcher
+        if field is None:
+            if prefetcher is not None:
+                field = prefetcher.get(name, num)
+            if field is None:
+                field = self._load_field(name, num, mmap)
+            if self._cache is not None:
+                self._cache.put((name, num), field, field.raw.nbytes)
+        if prefetcher is not None:
+            prefetcher.schedule(name, num)
+        return field
+
+    def _load_field(self, name: str, num: int, mmap: bool) -> Field:
+        """Load the field at a given output time from file.
+
+        Args:
+            name (str): The name of the field to load
+            num (str): The number of the field output time to load
+            mmap (bool): Whether to memory-map the field data file
 
         Returns:
             Field: The field
@@ -121,24 +283,430 @@ class Output:
             NotImplementedError: An invalid field was requested
         """
         if name == "gasdens":
-            return Density(self, num)
+            return Density(self, num, mmap=mmap)
         elif name == "gasenergy":
-            return Energy(self, num)
+            return Energy(self, num, mmap=mmap)
         elif name == "bx":
-            return MagneticField(self, "x", num)
+            return MagneticField(self, "x", num, mmap=mmap)
         elif name == "by":
-            return MagneticField(self, "y", num)
+            return MagneticField(self, "y", num, mmap=mmap)
         elif name == "bz":
-            return MagneticField(self, "z", num)
+            return MagneticField(self, "z", num, mmap=mmap)
         elif name == "gasvx":
-            return Velocity(self, "x", num)
+            return Velocity(self, "x", num, mmap=mmap)
         elif name == "gasvy":
-            return Velocity(self, "y", num)
+            return Velocity(self, "y", num, mmap=mmap)
         elif name == "gasvz":
-            return Velocity(self, "z", num)
+            return Velocity(self, "z", num, mmap=mmap)
         else:
             raise NotImplementedError
 
+    def get_slice(
+        self,
+        name: str,
+        num: int,
+        x: int | None = None,
+        y: int | None = None,
+        z: int | None = None,
+    ) -> NDArray[float64]:
+        """Load a slice of a field at a given output time.
+
+        Only the parts of the field data file containing the slice are read, e.g.
+        a plane of constant z is a single contiguous block of the file, and a plane
+        of constant y is nz contiguous rows of nx values.
+
+        Args:
+            name (str): The name of the field to get
+            num (int): The number of the field output time to get
+            x (int | None): The x index at which to slice the field
+            y (int | None): The y index at which to slice the field
+            z (int | None): The z index at which to slice the field
+
+        Returns:
+            NDArray: The field values in the slice, with one dimension fewer than
+                     the field for each index given
+
+        Raises:
+            NotImplementedError: An invalid field was requested
+            ValueError: No index was given
+        """
+        if name not in FIELD_NAMES:
+            raise NotImplementedError
+        if x is None and y is None and z is None:
+            raise ValueError("At least one of x, y and z must be given.")
+
+        filename = f"{self._directory / name}{num}{'.dat'}"
+        shape = (self.nx, self.ny, self.nz)
+        try:
+            data = memmap(filename, dtype=self.dtype, mode="r", shape=shape, order="F")
+        except FileNotFoundError:
+            data = reshape(self._read_unmerged(filename), shape, order="F")
+        idx = tuple(slice(None) if i is None else i for i in (x, y, z))
+        return array(data[idx])
+
+    def scan(self) -> dict[str, dict[int, tuple[int, int]]]:
+        """Scan the output directory for field data files, updating the inventory.
+
+        Returns:
+            dict[str, dict[int, tuple[int, int]]]: The inventory of field data files
+        """
+        inventory: dict[str, dict[int, tuple[int, int]]] = {}
+        with scandir(self._directory) as entries:
+            for entry in entries:
+                match = SNAPSHOT_PATTERN.match(entry.name)
+                if match:
+                    stat = entry.stat()
+                    snapshots = inventory.setdefault(match[1], {})
+                    size, mtime = snapshots.get(int(match[2]), (0, 0))
+                    snapshots[int(match[2])] = (
+                        size + stat.st_size,
+                        max(mtime, stat.st_mtime_ns),
+                    )
+        self._inventory = {
+            name: dict(sorted(inventory[name].items()))
+            for name in FIELD_NAMES
+            if name in inventory
+        }
+        return self._inventory
+
+    def snapshots(self, name: str) -> list[int]:
+        """Get the output numbers at which a field was written.
+
+        Args:
+            name (str): The name of the field
+
+        Returns:
+            list[int]: The sorted output numbers
+
+        Raises:
+            NotImplementedError: An invalid field was requested
+        """
+        if name not in FIELD_NAMES:
+            raise NotImplementedError
+        return list(self.inventory.get(name, {}))
+
+    def iter_field(
+        self,
+        name: str,
+        nums: Iterable[int] | None = None,
+        reduce: Callable[[NDArray[float64]], Any] | None = None,
+    ) -> Iterator[Any]:
+        """Iterate over a field at a sequence of output times.
+
+        Each output is read into the same buffer, and reduce is applied to the
+        shaped field data, so that memory use does not grow with the number of
+        outputs. The data passed to reduce are overwritten by the next output, so
+        reduce should not return them, or a view of them.
+
+        Args:
+            name (str): The name of the field to iterate over
+            nums (Iterable[int] | None): The numbers of the field output times to
+                                         read, or None to read every output time
+            reduce (Callable | None): A function applied to the field data at each
+                                      output time
+
+        Yields:
+            Any: The result of reduce for each output, or a copy of the field data
+                 if reduce is None
+
+        Raises:
+            NotImplementedError: An invalid field was requested
+        """
+        if name not in FIELD_NAMES:
+            raise NotImplementedError
+
+        if nums is None:
+            nums = self.snapshots(name)
+        raw = empty(self.nx * self.ny * self.nz, dtype=self.dtype)
+        data = reshape(raw, (self.nx, self.ny, self.nz), order="F")
+        for num in nums:
+            filename = f"{self._directory / name}{num}{'.dat'}"
+            try:
+                _readinto(filename, raw)
+            except FileNotFoundError:
+                self._read_unmerged(filename, raw)
+            yield data.copy(order="F") if reduce is None else reduce(data)
+
+    def map_snapshots(
+        self,
+        func: Callable[[Field], Any],
+        field: str = "gasdens",
+        nums: Iterable[int] | None = None,
+        workers: int | None = None,
+        pool: str = "process",
+        errors: str = "raise",
+    ) -> list[Any]:
+        """Apply a function to a field at many output times in parallel.
+
+        Each output is loaded and passed to func by a worker of a process or thread
+        pool. When using a process pool, each worker opens the output once, and func
+        and its results must be picklable.
+
+        Args:
+            func (Callable): The function to apply to the field at each output time
+            field (str): The name of the field to load
+            nums (Iterable[int] | None): The numbers of the field output times to
+                                         load, or None to load every output time
+            workers (int | None): The number of workers, or None to use one per CPU
+            pool (str): The kind of pool to use, either "process" or "thread"
+            errors (str): Either "raise", to raise the first exception raised by a
+                          worker, or "return", to return exceptions in place of
+                          results
+
+        Returns:
+            list[Any]: The results of func, in the order of nums
+
+        Raises:
+            ValueError: If pool or errors are invalid
+        """
+        if errors not in ("raise", "return"):
+            raise ValueError(f"Unknown error handling {errors}")
+        if nums is None:
+            nums = self.snapshots(field)
+        executor: Executor
+        if pool == "process":
+            executor = ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(str(self._directory),)
+            )
+            output = None
+        elif pool == "thread":
+            executor = ThreadPoolExecutor(workers)
+            output = self
+        else:
+            raise ValueError(f"Unknown pool {pool}")
+
+        results = []
+        with executor:
+            futures = [
+                executor.submit(_map_snapshot, output, func, field, num) for num in nums
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exception:
+                    if errors == "raise":
+                        executor.shutdown(cancel_futures=True)
+                        raise
+                    results.append(exception)
+        return results
+
+    def render_frames(
+        self,
+        field: str = "gasdens",
+        nums: Iterable[int] | None = None,
+        dims: str = "xy",
+        csys: str = "polar",
+        outdir: str = ".",
+        workers: int | None = None,
+        idx: int = 0,
+        vmin: float | None = None,
+        vmax: float | None = None,
+        dpi: float = 100,
+        lod: bool | int = True,
+    ) -> list[Path]:
+        """Render a 2D slice of a field at many output times to PNG files.
+
+        The output times are split into a contiguous chunk for each worker of a
+        process pool, each of which renders its frames without a display, reusing a
+        single figure. The frames are named after the field and output number, e.g.
+        gasdens0042.png, padded so that they sort in order.
+
+        Args:
+            field (str): The name of the field to render
+            nums (Iterable[int] | None): The numbers of the field output times to
+                                         render, or None to render every output time
+            dims (str): The dimensions of the field to plot
+            csys (str): The coordinate system on which to plot the field
+            outdir (str): The path to the directory to write the frames to
+            workers (int | None): The number of workers, or None to use one per CPU
+            idx (int): The index of the slice to plot
+            vmin (float | None): The lower limit of the colour scale, or None to
+                                 scale each frame to its values
+            vmax (float | None): The upper limit of the colour scale, or None to
+                                 scale each frame to its values
+            dpi (float): The resolution of the frames in dots per inch
+            lod (bool | int): Whether to downsample the slices to the resolution of
+                              the frames, or the maximum number of cells to plot
+                              in each dimension
+
+        Returns:
+            list[Path]: The paths to the frames, in the order of nums
+        """
+        nums = list(self.snapshots(field) if nums is None else nums)
+        if not nums:
+            return []
+        outdir_path = Path(outdir)
+        outdir_path.mkdir(parents=True, exist_ok=True)
+        width = len(str(max(nums)))
+        filenames = [outdir_path / f"{field}{num:0{width}d}.png" for num in nums]
+        renderer = FrameRenderer(csys, dims, idx, vmin, vmax, dpi, lod)
+
+        nchunks = min(workers or cpu_count() or 1, len(nums))
+        bounds = [len(nums) * i // nchunks for i in range(nchunks + 1)]
+        with ProcessPoolExecutor(
+            nchunks, initializer=_init_worker, initargs=(str(self._directory),)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _render_frames,
+                    renderer,
+                    field,
+                    nums[start:end],
+                    filenames[start:end],
+                )
+                for start, end in pairwise(bounds)
+            ]
+            for future in futures:
+                future.result()
+        return filenames
+
+    def _read_unmerged(
+        self, filename: str, out: NDArray[float64] | None = None
+    ) -> NDArray[float64]:
+        """Read a field written by each MPI process to its own file.
+
+        FARGO3D runs without merged outputs write the subdomain of each process to
+        a file named like gasdens{num}_{rank}.dat. These files are read concurrently,
+        directly into their place in the global field.
+
+        Args:
+            filename (str): The path to the merged field data file
+            out (NDArray | None): A contiguous buffer of nx * ny * nz values to read
+                                  the field into
+
+        Returns:
+            NDArray: The raw field data
+
+        Raises:
+            FileNotFoundError: If there are no files for the field
+            ValueError: If the files do not match the subdomains of the processes
+        """
+        stem = Path(filename[: -len(".dat")])
+        files = {}
+        for path in stem.parent.glob(f"{stem.name}_*.dat"):
+            rank = path.stem.rpartition("_")[2]
+            if rank.isdigit():
+                files[int(rank)] = path
+        if not files:
+            raise FileNotFoundError(f"No such file or per-process files: '{filename}'")
+
+        subdomains = self._decomposition(files)
+        if files.keys() != subdomains.keys():
+            missing = sorted(subdomains.keys() - files.keys())
+            unknown = sorted(files.keys() - subdomains.keys())
+            raise ValueError(
+                f"The per-process files of {filename} do not match the subdomains of "
+                f"the processes: files missing for ranks {missing}, subdomains "
+                f"unknown for ranks {unknown}."
+            )
+
+        if out is None:
+            out = empty(self.nx * self.ny * self.nz, dtype=self.dtype)
+        with ThreadPoolExecutor(min(32, len(files))) as executor:
+            futures = [
+                executor.submit(
+                    _read_subdomain, path, out, self.nx, self.ny, subdomains[rank]
+                )
+                for rank, path in files.items()
+            ]
+            for future in futures:
+                future.result()
+        return out
+
+    def _decomposition(
+        self, files: dict[int, Path]
+    ) -> dict[int, tuple[int, int, int, int]]:
+        """Get the subdomain of the global grid of each MPI process.
+
+        The start and end y and z indices of each process's subdomain are read from
+        the grid{rank}.inf file it writes. Without these, a 2D output is assumed to
+        be split along y in rank order, with the extent of each subdomain found from
+        the size of the process's file.
+
+        Args:
+            files (dict[int, Path]): The field data file of each process
+
+        Returns:
+            dict[int, tuple[int, int, int, int]]: The start and end y and z indices
+                                                  of each process's subdomain
+
+        Raises:
+            ValueError: If the subdomains cannot be determined
+        """
+        if self._subdomains is None:
+            subdomains = {}
+            for path in self._directory.glob("grid*.inf"):
+                for line in path.read_text().splitlines():
+                    values = line.split()[:5]
+                    if len(values) == 5 and all(v.isdigit() for v in values):
+                        rank, y0, y1, z0, z1 = (int(v) for v in values)
+                        subdomains[rank] = (y0, y1, z0, z1)
+                        break
+
+            if not subdomains and self.nz == 1:
+                y0 = 0
+                for rank in sorted(files):
+                    ny = files[rank].stat().st_size // (self.nx * self.dtype.itemsize)
+                    subdomains[rank] = (y0, y0 + ny, 0, 1)
+                    y0 += ny
+                if y0 != self.ny:
+                    raise ValueError("The per-process files do not cover the domain.")
+            elif not subdomains:
+                raise ValueError("The subdomains of the MPI processes are unknown.")
+            coverage = zeros((self.nz, self.ny), dtype=int64)
+            for y0, y1, z0, z1 in subdomains.values():
+                if not (0 <= y0 <= y1 <= self.ny and 0 <= z0 <= z1 <= self.nz):
+                    raise ValueError("The per-process subdomains exceed the domain.")
+                coverage[z0:z1, y0:y1] += 1
+            if (coverage != 1).any():
+                raise ValueError("The per-process subdomains do not tile the domain.")
+            self._subdomains = subdomains
+        return self._subdomains
+
+    @property
+    def cache(self) -> Cache | None:
+        """The cache of loaded fields.
+
+        Returns:
+            Cache | None: The cache, or None if caching is not enabled
+        """
+        return self._cache
+
+    @property
+    def grids(self) -> Grids:
+        """The coordinate grids of the output, shared between its fields.
+
+        Returns:
+            Grids: The registry of the output's coordinate grids
+        """
+        return self._grids
+
+    @property
+    def prefetcher(self) -> Prefetcher | None:
+        """The prefetcher of fields at upcoming output times.
+
+        Returns:
+            Prefetcher | None: The prefetcher, or None if prefetching is disabled
+        """
+        return self._prefetcher
+
+    @property
+    def inventory(self) -> dict[str, dict[int, tuple[int, int]]]:
+        """The field data files in the output directory.
+
+        The directory is scanned the first time the inventory is used. Call scan to
+        find files written since.
+
+        Returns:
+            dict[str, dict[int, tuple[int, int]]]: The size in bytes and
+                                                   modification time in nanoseconds
+                                                   of the data files of each field,
+                                                   by output number
+        """
+        if self._inventory is None:
+            self.scan()
+        return self._inventory
+
     @property
     def coordinate_system(self) -> str:
         """The coordinate system used in the simulation.
@@ -147,12 +715,21 @@ class Output:
             str: The coordinate system used in the simulation
 
         Raises:
-            Exception: If _read_opts has not been executed
+            FileNotFoundError: If the output's variables file does not exist
         """
-        try:
-            return self._vars["COORDINATES"]
-        except AttributeError:
-            raise Exception("Output variables have not been read.")
+        return self._vars["COORDINATES"]
+
+    @property
+    def dtype(self) -> dtype:
+        """The data type of the field values in the output's data files.
+
+        Field values are single-precision if FARGO3D was compiled with FLOAT, and
+        double-precision otherwise.
+
+        Returns:
+            dtype: The data type of the field values
+        """
+        return dtype(float32 if self.get_opt("FLOAT") else float64)
 
     @property
     def includes_ghosts(self) -> bool:
@@ -162,12 +739,9 @@ class Output:
             bool: Whether ghost cells are included in the field data files
 
         Raises:
-            Exception: If _read_opts has not been executed
+            FileNotFoundError: If the output's summary0 file does not exist
         """
-        try:
-            return "WRITEGHOSTS" in self._opts
-        except AttributeError:
-            raise Exception("Simulation options have not been read.")
+        return "WRITEGHOSTS" in self._opts
 
     @property
     def xdomain(self) -> NDArray[float64]:
@@ -177,12 +751,9 @@ class Output:
             NDArray: A numpy array containing the x-coordinates
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return self._xdomain
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return self._xdomain
 
     @property
     def ydomain(self) -> NDArray[float64]:
@@ -192,12 +763,9 @@ class Output:
             NDArray: A numpy array containing the y-coordinates
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return self._ydomain
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return self._ydomain
 
     @property
     def zdomain(self) -> NDArray[float64]:
@@ -207,12 +775,9 @@ class Output:
             NDArray: A numpy array containing the z-coordinates
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return self._zdomain
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return self._zdomain
 
     @property
     def nx(self) -> int:
@@ -222,12 +787,9 @@ class Output:
             int: The number of cells used in the x dimension.
 
         Raises:
-            Exception: If _read_vars has not been executed
+            FileNotFoundError: If the output's variables file does not exist
         """
-        try:
-            return int(self._vars["NX"])
-        except AttributeError:
-            raise Exception("Output variables have not been read.")
+        return int(self._vars["NX"])
 
     @property
     def ny(self) -> int:
@@ -237,12 +799,9 @@ class Output:
             int: The number of cells used in the y dimension.
 
         Raises:
-            Exception: If _read_vars has not been executed
+            FileNotFoundError: If the output's variables file does not exist
         """
-        try:
-            return int(self._vars["NY"])
-        except AttributeError:
-            raise Exception("Output variables have not been read.")
+        return int(self._vars["NY"])
 
     @property
     def nz(self) -> int:
@@ -252,12 +811,9 @@ class Output:
             int: The number of cells used in the z dimension.
 
         Raises:
-            Exception: If _read_vars has not been executed
+            FileNotFoundError: If the output's variables file does not exist
         """
-        try:
-            return int(self._vars["NZ"])
-        except AttributeError:
-            raise Exception("Output variables have not been read.")
+        return int(self._vars["NZ"])
 
     @property
     def nghx(self) -> int:
@@ -267,12 +823,9 @@ class Output:
             int: The number of ghost cells used in the x dimension.
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return int((len(self._xdomain) - self.nx - 1) / 2)
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return int((len(self._xdomain) - self.nx - 1) / 2)
 
     @property
     def nghy(self) -> int:
@@ -282,12 +835,9 @@ class Output:
             int: The number of ghost cells used in the y dimension.
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return int((len(self._ydomain) - self.ny - 1) / 2)
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return int((len(self._ydomain) - self.ny - 1) / 2)
 
     @property
     def nghz(self) -> int:
@@ -297,9 +847,178 @@ class Output:
             int: The number of ghost cells used in the z dimension.
 
         Raises:
-            Exception: If _read_domains has not been executed
+            FileNotFoundError: If the output's dimensions files do not exist
         """
-        try:
-            return int((len(self._zdomain) - self.nz - 1) / 2)
-        except AttributeError:
-            raise Exception("Output domains have not been read.")
+        return int((len(self._zdomain) - self.nz - 1) / 2)
+
+
+_worker_output: Output | None = None
+
+
+def _init_worker(directory: str) -> None:
+    """Open the output used by a process pool worker.
+
+    Args:
+        directory (str): The path to the directory containing the output files
+    """
+    global _worker_output
+    _worker_output = Output(directory)
+
+
+def _map_snapshot(
+    output: Output | None, func: Callable[[Field], Any], name: str, num: int
+) -> Any:
+    """Apply a function to a field at a given output time.
+
+    Args:
+        output (Output | None): The output, or None to use the worker's output
+        func (Callable): The function to apply to the field
+        name (str): The name of the field to load
+        num (int): The number of the field output time to load
+
+    Returns:
+        Any: The result of func
+    """
+    if output is None:
+        output = _worker_output
+    return func(output.get_field(name, num))
+
+
+def _render_frames(
+    renderer: FrameRenderer,
+    name: str,
+    nums: list[int],
+    filenames: list[Path],
+) -> None:
+    """Render a field at a sequence of output times to image files in a worker.
+
+    Args:
+        renderer (FrameRenderer): The renderer of the frames
+        name (str): The name of the field to render
+        nums (list[int]): The numbers of the field output times to render
+        filenames (list[Path]): The paths to the image files
+    """
+    for num, filename in zip(nums, filenames, strict=True):
+        renderer.render(_worker_output.get_field(name, num), filename)
+
+
+def _read_domains_cache(
+    filename: Path, header: list[int]
+) -> list[NDArray[float64]] | None:
+    """Read the domains from a binary cache file, if it is up to date.
+
+    The cache file contains the modification times and sizes of the dimensions
+    files it was created from, then the number of values in each domain, followed
+    by the domains.
+
+    Args:
+        filename (Path): The path to the cache file
+        header (list[int]): The modification times and sizes of the dimensions files
+
+    Returns:
+        list[NDArray] | None: The x, y and z domains, or None if the cache file does
+                              not exist or is out of date
+    """
+    try:
+        with open(filename, "rb") as fid:
+            cached_header = fromfile(fid, dtype=int64, count=len(header) + 3)
+            if cached_header[: len(header)].tolist() != header:
+                return None
+            counts = cached_header[len(header) :]
+            data = fromfile(fid, dtype=float64)
+    except (OSError, ValueError):
+        return None
+    if len(counts) != 3 or data.size != counts.sum():
+        return None
+    return split(data, counts.cumsum()[:-1])
+
+
+def _write_domains_cache(
+    filename: Path, header: list[int], domains: list[NDArray[float64]]
+) -> None:
+    """Write the domains to a binary cache file, if the output directory is writable.
+
+    The file is written under a temporary name and then renamed, so that outputs
+    being read concurrently never see a partly written cache file.
+
+    Args:
+        filename (Path): The path to the cache file
+        header (list[int]): The modification times and sizes of the dimensions files
+        domains (list[NDArray]): The x, y and z domains
+    """
+    counts = [domain.size for domain in domains]
+    temp_filename = filename.with_name(f"{filename.name}.{getpid()}")
+    try:
+        with open(temp_filename, "wb") as fid:
+            array(header + counts, dtype=int64).tofile(fid)
+            concatenate(domains).astype(float64).tofile(fid)
+        replace(temp_filename, filename)
+    except OSError:
+        temp_filename.unlink(missing_ok=True)
+
+
+def _readinto(filename: str, buffer: NDArray[float64]) -> None:
+    """Read a field data file into an existing buffer.
+
+    Args:
+        filename (str): The path to the field data file
+        buffer (NDArray): The contiguous buffer to read the data into
+
+    Raises:
+        ValueError: If the size of the file does not match the buffer
+    """
+    with open(filename, "rb", buffering=0) as fid:
+        _fill(fid, buffer)
+        if fid.read(1):
+            raise ValueError(f"{filename} contains more values than expected.")
+
+
+def _read_subdomain(
+    filename: Path,
+    raw: NDArray[float64],
+    nx: int,
+    ny: int,
+    subdomain: tuple[int, int, int, int],
+) -> None:
+    """Read the field data file of an MPI process into the global field.
+
+    Each z-plane of the subdomain is a contiguous block of the global field data,
+    so the planes are read directly into place.
+
+    Args:
+        filename (Path): The path to the process's field data file
+        raw (NDArray): The contiguous buffer of global field data
+        nx (int): The number of cells in the x dimension of the global field
+        ny (int): The number of cells in the y dimension of the global field
+        subdomain (tuple[int, int, int, int]): The start and end y and z indices of
+                                               the process's subdomain
+
+    Raises:
+        ValueError: If the size of the file does not match the subdomain
+    """
+    y0, y1, z0, z1 = subdomain
+    with open(filename, "rb", buffering=0) as fid:
+        for k in range(z0, z1):
+            start = (k * ny + y0) * nx
+            _fill(fid, raw[start : start + (y1 - y0) * nx])
+        if fid.read(1):
+            raise ValueError(f"{filename} contains more values than expected.")
+
+
+def _fill(fid: FileIO, buffer: NDArray[float64]) -> None:
+    """Fill a buffer with the next values in an open file.
+
+    Args:
+        fid (FileIO): The unbuffered binary file to read from
+        buffer (NDArray): The contiguous buffer to read the data into
+
+    Raises:
+        ValueError: If the file ends before the buffer is filled
+    """
+    view = memoryview(buffer).cast("B")
+    nread = 0
+    while nread < len(view):
+        n = fid.readinto(view[nread:])
+        if not n:
+            raise ValueError(f"{fid.name} contains fewer values than expected.")
+        nread += n
@@ -0,0 +1,105 @@
+"""Background loading of the fields at upcoming output times."""
+
+from bisect import bisect_right
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
+from fargonaut.field import Field
+
+
+class Prefetcher:
+    """Loads the fields at the output times following those requested.
+
+    When the field at an output time is requested, the same field at the next
+    depth output times is loaded in background threads, so that reading it from
+    disk overlaps with processing the requested field.
+
+    Attributes:
+        depth: The number of output times loaded ahead
+        hits: The number of requested fields which had been prefetched
+    """
+
+    def __init__(self, output, depth: int, workers: int | None = None) -> None:
+        """Start a pool of threads for prefetching fields.
+
+        Args:
+            output: The FARGO3D simulation output
+            depth (int): The number of output times to load ahead
+            workers (int | None): The number of threads, or None to use one per
+                                  output time loaded ahead
+
+        Raises:
+            ValueError: If depth is less than 1
+        """
+        if depth < 1:
+            raise ValueError(f"Invalid prefetch depth {depth}")
+        self._output = output
+        self._depth = depth
+        self._executor = ThreadPoolExecutor(workers or depth)
+        self._futures: dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self.hits = 0
+
+    def get(self, name: str, num: int) -> Field | None:
+        """Take a prefetched field, waiting for it to finish loading.
+
+        Args:
+            name (str): The name of the field
+            num (int): The number of the field output time
+
+        Returns:
+            Field | None: The field, or None if it was not prefetched
+        """
+        with self._lock:
+            future = self._futures.pop((name, num), None)
+        if future is None or future.cancelled():
+            return None
+        field = future.result()
+        self.hits += 1
+        return field
+
+    def schedule(self, name: str, num: int) -> None:
+        """Prefetch a field at the output times following one, in the background.
+
+        The output times are taken from the output's inventory. Prefetches of the
+        field at other output times that have not started are cancelled.
+
+        Args:
+            name (str): The name of the field
+            num (int): The number of the current field output time
+        """
+        nums = self._output.snapshots(name)
+        start = bisect_right(nums, num)
+        keys = [(name, n) for n in nums[start : start + self._depth]]
+        cache = self._output.cache
+        with self._lock:
+            for key in [key for key in self._futures if key[0] == name]:
+                if key not in keys:
+                    self._futures.pop(key).cancel()
+            for key in keys:
+                if key not in self._futures and (cache is None or key not in cache):
+                    self._futures[key] = self._executor.submit(
+                        self._output._load_field, *key, False
+                    )
+
+    def cancel(self) -> None:
+        """Cancel all prefetches that have not started, and discard the others."""
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    def shutdown(self) -> None:
+        """Cancel all prefetches and stop the pool of threads."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def depth(self) -> int:
+        """The number of output times loaded ahead.
+
+        Returns:
+            int: The number of output times loaded ahead
+        """
+        return self._depth
@@ -0,0 +1,100 @@
+"""Rendering of field slices to image files, e.g. the frames of a movie."""
+
+from pathlib import Path
+
+from matplotlib.collections import QuadMesh
+from matplotlib.figure import Figure
+
+from fargonaut.downsample import downsample, resolution
+from fargonaut.field import Field
+
+
+class FrameRenderer:
+    """Renders 2D slices of fields to image files, reusing a single figure.
+
+    The figure is drawn with the Agg backend, independently of pyplot, so frames
+    can be rendered without a display. The mesh, labels and colorbar are drawn for
+    the first frame, after which only the field values of the mesh are updated.
+    Slices with more cells than the images have pixels are downsampled first.
+
+    Attributes:
+        csys: The coordinate system on which to plot the fields
+        dims: The dimensions of the fields to plot
+        idx: The index of the slice to plot
+    """
+
+    def __init__(
+        self,
+        csys: str = "polar",
+        dims: str = "xy",
+        idx: int = 0,
+        vmin: float | None = None,
+        vmax: float | None = None,
+        dpi: float = 100,
+        lod: bool | int = True,
+        lod_method: str = "mean",
+    ) -> None:
+        """Create a frame renderer.
+
+        Args:
+            csys (str): The coordinate system on which to plot the fields
+            dims (str): The dimensions of the fields to plot
+            idx (int): The index of the slice to plot
+            vmin (float | None): The lower limit of the colour scale, or None to
+                                 scale each frame to its values
+            vmax (float | None): The upper limit of the colour scale, or None to
+                                 scale each frame to its values
+            dpi (float): The resolution of the images in dots per inch
+            lod (bool | int): Whether to downsample the slices to the resolution of
+                              the images, or the maximum number of cells to plot
+                              in each dimension
+            lod_method (str): How blocks of cells are combined when downsampling,
+                              either "mean", "min" or "max"
+        """
+        self.csys = csys
+        self.dims = dims
+        self.idx = idx
+        self._vmin = vmin
+        self._vmax = vmax
+        self._dpi = dpi
+        self._lod = lod
+        self._lod_method = lod_method
+        self._fig: Figure | None = None
+        self._mesh: QuadMesh | None = None
+
+    def render(self, field: Field, filename: str | Path) -> None:
+        """Render a 2D slice of a field to an image file.
+
+        Every field rendered is expected to be defined on the same grid.
+
+        Args:
+            field (Field): The field to render
+            filename (str | Path): The path to the image file
+        """
+        X, Y, C, xlabel, ylabel, clabel = field._get_2D_plot_data(
+            self.csys, self.dims, self.idx
+        )
+        if self._mesh is None:
+            self._fig = Figure(dpi=self._dpi)
+            axs = self._fig.add_subplot(111)
+            if self._lod:
+                n = resolution(axs) if self._lod is True else self._lod
+                X, Y, C = downsample(X, Y, C, (n, n), self._lod_method)
+            self._mesh = axs.pcolormesh(
+                X, Y, C, shading="flat", vmin=self._vmin, vmax=self._vmax
+            )
+            axs.set_xlabel(xlabel)
+            axs.set_ylabel(ylabel)
+            cb = self._fig.colorbar(self._mesh)
+            cb.set_label(clabel)
+        else:
+            if self._lod:
+                shape = self._mesh.get_array().shape
+                X, Y, C = downsample(X, Y, C, shape, self._lod_method)
+            self._mesh.set_array(C)
+            if self._vmin is None or self._vmax is None:
+                self._mesh.set_clim(
+                    C.min() if self._vmin is None else self._vmin,
+                    C.max() if self._vmax is None else self._vmax,
+                )
+        self._fig.savefig(filename)
@@ -6,11 +6,32 @@ import unittest
 import unittest.mock
 from pathlib import Path
 
-from numpy import array, cos, sin
+from numpy import (
+    add,
+    amax,
+    arange,
+    arctan2,
+    array,
+    asarray,
+    concatenate,
+    cos,
+    dtype,
+    empty,
+    float32,
+    float64,
+    log10,
+    mean,
+    meshgrid,
+    shares_memory,
+    sin,
+    sqrt,
+)
 from numpy.random import rand
 from numpy.testing import assert_array_equal
 
+from fargonaut.field import DerivedField
 from fargonaut.fields.density import Density
+from fargonaut.grids import Grids
 
 TEMPDIR = tempfile.gettempdir()
 GASDENS1_FILE_NAME = TEMPDIR + "/gasdens1.dat"
@@ -34,6 +55,8 @@ class TestDensity(unittest.TestCase):
         output.nghx = 1
         output.nghy = 3
         output.nghz = 1
+        output.dtype = dtype(float64)
+        output.grids = Grids(output)
 
         cls.gasdens1_file = tempfile.NamedTemporaryFile(
             delete=False, mode="w+b", suffix=".dat"
@@ -61,6 +84,10 @@ class TestDensity(unittest.TestCase):
         self.assertEqual(self.density._output, self.output)
         assert_array_equal(self.density._raw, GASDENS1)
 
+        density = Density(self.output, 1, mmap=True)
+        assert_array_equal(density._raw, GASDENS1)
+        assert_array_equal(density._data, GASDENS1.reshape((2, 3, 1), order="F"))
+
     def test_process_domains(self) -> None:
         """Test Density's _process_domains method."""
         xdata_expected = (
@@ -85,6 +112,7 @@ class TestDensity(unittest.TestCase):
         assert_array_equal(self.density._xdata, xdata_expected)
         assert_array_equal(self.density._ydata, ydata_expected)
         assert_array_equal(self.density._zdata, zdata_expected)
+        self.assertEqual(self.density._grid, (self.output.grids, None))
 
     def test_get_2D_cartesian_plot_data(self) -> None:
         """Test Density's _get_2D_cartesian_plot_data method."""
@@ -740,7 +768,7 @@ class TestDensity(unittest.TestCase):
             unittest.mock.patch("matplotlib.pyplot.colorbar"),
             unittest.mock.patch("matplotlib.pyplot.show"),
         ):
-            self.density.plot(csys="polar", dims="xy", idx=0)
+            self.density.plot(csys="polar", dims="xy", idx=0, lod=False)
         cylindrical_2D_mock.assert_called_once_with("polar", "xy", 0)
 
         cartesian_2D_mock.return_value = ("X", "Y", "C", "xlabel", "ylabel", "clabel")
@@ -751,7 +779,7 @@ class TestDensity(unittest.TestCase):
             unittest.mock.patch("matplotlib.pyplot.colorbar"),
             unittest.mock.patch("matplotlib.pyplot.show"),
         ):
-            self.density.plot(csys="polar", dims="xy", idx=0)
+            self.density.plot(csys="polar", dims="xy", idx=0, lod=False)
         cartesian_2D_mock.assert_called_once_with("polar", "xy", 0)
 
         spherical_2D_mock.return_value = ("X", "Y", "C", "xlabel", "ylabel", "clabel")
@@ -762,7 +790,7 @@ class TestDensity(unittest.TestCase):
             unittest.mock.patch("matplotlib.pyplot.colorbar"),
             unittest.mock.patch("matplotlib.pyplot.show"),
         ):
-            self.density.plot(csys="polar", dims="xy", idx=0)
+            self.density.plot(csys="polar", dims="xy", idx=0, lod=False)
         spherical_2D_mock.assert_called_once_with("polar", "xy", 0)
 
         cylindrical_1D_mock.return_value = ("X", "Y", "xlabel", "ylabel")
@@ -842,6 +870,20 @@ class TestDensity(unittest.TestCase):
         with self.assertRaises(Exception):
             self.density._check_valid_for_arithmetic(field2, "arithmetic_operation")
 
+        field2._xdata = self.density._xdata.copy()
+        field2._xdata[0] += 1.0
+        with self.assertRaises(Exception):
+            self.density._check_valid_for_arithmetic(field2, "arithmetic_operation")
+
+        field2._grid = self.density._grid
+        self.assertEqual(
+            None,
+            self.density._check_valid_for_arithmetic(field2, "arithmetic_operation"),
+        )
+        field2._grid = (self.output.grids, "x")
+        with self.assertRaises(Exception):
+            self.density._check_valid_for_arithmetic(field2, "arithmetic_operation")
+
     def test_add(self) -> None:
         """Test Field's __add__ method."""
         field2 = unittest.mock.Mock(spec=self.density)
@@ -886,7 +928,169 @@ class TestDensity(unittest.TestCase):
         result = self.density / field2
         assert_array_equal(self.density._raw / field2._raw, result._raw)
 
+    @unittest.mock.patch("fargonaut.fields.density.Density._get_1D_plot_data")
+    @unittest.mock.patch("fargonaut.fields.density.Density._get_2D_plot_data")
+    def test_plot_reuse(self, plot_2D_mock, plot_1D_mock) -> None:
+        """Test Field's plot method with existing axes and plots."""
+        plot_2D_mock.return_value = ("X", "Y", "C", "xlabel", "ylabel", "clabel")
+        plot_1D_mock.return_value = ("X", "Y", "xlabel", "ylabel")
+        ax = unittest.mock.Mock()
+        with unittest.mock.patch("matplotlib.pyplot.show") as show_mock:
+            fig, axs, cb = self.density.plot(
+                csys="polar", dims="xy", idx=0, ax=ax, lod=False
+            )
+            ax.pcolormesh.assert_called_once_with("X", "Y", "C", shading="flat")
+            ax.figure.colorbar.assert_called_once_with(
+                ax.pcolormesh.return_value, ax=ax
+            )
+            self.assertIs(fig, ax.figure)
+            self.assertIs(axs, ax)
+            self.assertIs(cb, ax.figure.colorbar.return_value)
+
+            mesh = unittest.mock.Mock()
+            fig, axs, cb = self.density.plot(
+                csys="polar", dims="xy", artist=mesh, lod=False
+            )
+            mesh.set_array.assert_called_once_with("C")
+            mesh.autoscale.assert_called_once()
+            mesh.figure.canvas.draw_idle.assert_called_once()
+            self.assertIs(cb, mesh.colorbar)
+
+            fig, axs = self.density.plot(csys="polar", dims="x", idx=(0, 0), ax=ax)
+            ax.plot.assert_called_once_with("X", "Y")
+
+            line = unittest.mock.Mock()
+            self.density.plot(csys="polar", dims="x", idx=(0, 0), artist=line)
+            line.set_data.assert_called_once_with("X", "Y")
+            line.axes.autoscale_view.assert_called_once()
+            show_mock.assert_not_called()
+
+            self.density.plot(
+                csys="polar", dims="xy", artist=mesh, show=True, lod=False
+            )
+            show_mock.assert_called_once()
+
+    @unittest.mock.patch("fargonaut.fields.density.Density._get_2D_plot_data")
+    def test_plot_lod(self, plot_2D_mock) -> None:
+        """Test Field's plot method downsamples large slices."""
+        X, Y = meshgrid(arange(9.0), arange(5.0), indexing="ij")
+        C = arange(32.0).reshape((8, 4))
+        plot_2D_mock.return_value = (X, Y, C, "xlabel", "ylabel", "clabel")
+        ax = unittest.mock.Mock()
+        ax.get_window_extent.return_value.width = 4
+        ax.get_window_extent.return_value.height = 2
+        self.density.plot(csys="polar", dims="xy", ax=ax)
+        X_lod, Y_lod, C_lod = ax.pcolormesh.call_args.args
+        assert_array_equal(X_lod, X[::2, :])
+        assert_array_equal(Y_lod, Y[::2, :])
+        assert_array_equal(C_lod, (C[::2, :] + C[1::2, :]) / 2)
+
+        self.density.plot(csys="polar", dims="xy", ax=ax, lod=2, lod_method="max")
+        X_lod, Y_lod, C_lod = ax.pcolormesh.call_args.args
+        assert_array_equal(X_lod, X[::4, ::2])
+        assert_array_equal(C_lod, C[3::4, 1::2])
+
+        mesh = unittest.mock.Mock()
+        mesh.get_array.return_value = C_lod
+        self.density.plot(csys="polar", dims="xy", artist=mesh, lod_method="max")
+        assert_array_equal(mesh.set_array.call_args.args[0], C[3::4, 1::2])
+
+        self.density.plot(csys="polar", dims="xy", ax=ax, lod=False)
+        self.assertIs(ax.pcolormesh.call_args.args[2], C)
+
     def test_pow(self) -> None:
         """Test Field's __pow__ method."""
         result = self.density**2
         assert_array_equal(self.density._raw**2, result._raw)
+
+    def test_scalar_arithmetic(self) -> None:
+        """Test Field's arithmetic methods with scalar operands."""
+        raw = self.density._raw
+        assert_array_equal((self.density + 2)._raw, raw + 2)
+        assert_array_equal((2 + self.density)._raw, 2 + raw)
+        assert_array_equal((1 - self.density)._raw, 1 - raw)
+        assert_array_equal((self.density * 0.5)._raw, raw * 0.5)
+        assert_array_equal((3 / self.density)._raw, 3 / raw)
+        assert_array_equal((2**self.density)._raw, 2**raw)
+        assert_array_equal((self.density * array(2.0))._raw, raw * 2)
+        self.assertEqual(
+            (2 * self.density).symbol, r"2 \times \mathit{\Sigma}_\mathrm{g}"
+        )
+        with self.assertRaises(Exception):
+            self.density * "2"
+
+    def test_broadcast_arithmetic(self) -> None:
+        """Test Field's arithmetic methods with array operands."""
+        data = self.density._data
+        profile = array([1.0, 2.0, 4.0])
+        result = self.density * profile
+        self.assertIsInstance(result, DerivedField)
+        assert_array_equal(result._data, data * profile.reshape((1, 3, 1)))
+        result = profile / self.density
+        self.assertIsInstance(result, DerivedField)
+        assert_array_equal(result._data, profile.reshape((1, 3, 1)) / data)
+        assert_array_equal(
+            (self.density - array([1.0, 2.0]))._data,
+            data - array([1.0, 2.0]).reshape((2, 1, 1)),
+        )
+
+        values = rand(2, 1, 1)
+        assert_array_equal((self.density + values)._data, data + values)
+        assert_array_equal(((self.density + values) * 2)._data, (data + values) * 2)
+
+        with self.assertRaises(ValueError):
+            self.density * array([1.0, 2.0, 3.0, 4.0])
+        with self.assertRaises(ValueError):
+            self.density * rand(3, 2, 1)
+        with self.assertRaises(ValueError):
+            self.density * rand(2, 3)
+
+    def test_array_ufunc(self) -> None:
+        """Test Field's __array_ufunc__ method."""
+        data = self.density._data
+        result = sqrt(self.density)
+        self.assertIsInstance(result, DerivedField)
+        assert_array_equal(result._data, sqrt(data))
+        assert_array_equal(result.x, self.density.x)
+        self.assertEqual(
+            result.symbol, r"\mathrm{sqrt}\left(\mathit{\Sigma}_\mathrm{g}\right)"
+        )
+        result = log10(self.density * 2)
+        assert_array_equal(result._data, log10(data * 2))
+        assert_array_equal(arctan2(self.density, 1.0)._data, arctan2(data, 1.0))
+
+        result = array([1.0, 2.0, 4.0]) * self.density
+        self.assertIsInstance(result, DerivedField)
+        assert_array_equal(result._data, array([1.0, 2.0, 4.0])[:, None] * data)
+        self.assertEqual(result.symbol, r"\ldots \times \mathit{\Sigma}_\mathrm{g}")
+
+        acc = self.density.astype(float64)
+        values = acc._data
+        self.assertIs(sqrt(self.density, out=acc), acc)
+        self.assertIs(acc._values, values)
+        assert_array_equal(acc._data, sqrt(data))
+        out = empty((2, 3, 1))
+        self.assertIs(add(self.density, acc, out=out), out)
+        assert_array_equal(out, data + sqrt(data))
+        with self.assertRaises(ValueError):
+            sqrt(self.density, out=empty((3, 2, 1)))
+        with self.assertRaises(ValueError):
+            sqrt(self.density, where=data > 0.5)
+        with self.assertRaises(ValueError):
+            sqrt(self.density, out=acc, where=data > 0.5)
+        self.assertEqual(sqrt(self.density, dtype=float32)._data.dtype, float32)
+
+        result = add.reduce(self.density, axis=1)
+        self.assertNotIsInstance(result, DerivedField)
+        assert_array_equal(result, add.reduce(data, axis=1))
+
+    def test_array_function(self) -> None:
+        """Test Field's __array_function__ and __array__ methods."""
+        data = self.density._data
+        self.assertEqual(mean(self.density), data.mean())
+        assert_array_equal(amax(self.density, axis=0), data.max(axis=0))
+        assert_array_equal(
+            concatenate([self.density, self.density + 1]), concatenate([data, data + 1])
+        )
+        self.assertTrue(shares_memory(asarray(self.density), data))
+        self.assertEqual(asarray(self.density, dtype=float32).dtype, float32)
@@ -6,11 +6,12 @@ import unittest
 import unittest.mock
 from pathlib import Path
 
-from numpy import array, cos, sin
+from numpy import array, cos, dtype, float64, sin
 from numpy.random import rand
 from numpy.testing import assert_array_equal
 
 from fargonaut.fields.energy import Energy
+from fargonaut.grids import Grids
 
 TEMPDIR = tempfile.gettempdir()
 GASENERGY1_FILE_NAME = TEMPDIR + "/gasenergy1.dat"
@@ -34,6 +35,8 @@ class TestEnergy(unittest.TestCase):
         output.nghx = 1
         output.nghy = 3
         output.nghz = 1
+        output.dtype = dtype(float64)
+        output.grids = Grids(output)
         output.get_opt.return_value = False
 
         cls.gasenergy1_file = tempfile.NamedTemporaryFile(
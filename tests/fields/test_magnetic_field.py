@@ -6,11 +6,12 @@ import unittest
 import unittest.mock
 from pathlib import Path
 
-from numpy import array, cos, sin
+from numpy import array, cos, dtype, float64, sin
 from numpy.random import rand
 from numpy.testing import assert_array_equal
 
 from fargonaut.fields.magnetic_field import MagneticField
+from fargonaut.grids import Grids
 
 TEMPDIR = tempfile.gettempdir()
 BX1_FILE_NAME = TEMPDIR + "/bx1.dat"
@@ -38,6 +39,8 @@ class TestMagneticField(unittest.TestCase):
         output.nghx = 1
         output.nghy = 3
         output.nghz = 1
+        output.dtype = dtype(float64)
+        output.grids = Grids(output)
 
         cls.bx1_file = tempfile.NamedTemporaryFile(
             delete=False, mode="w+b", suffix=".dat"
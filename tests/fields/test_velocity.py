@@ -6,11 +6,12 @@ import unittest
 import unittest.mock
 from pathlib import Path
 
-from numpy import array, cos, sin
+from numpy import array, concatenate, cos, dtype, empty, float64, roll, sin
 from numpy.random import rand
 from numpy.testing import assert_array_equal
 
 from fargonaut.fields.velocity import Velocity
+from fargonaut.grids import Grids
 
 TEMPDIR = tempfile.gettempdir()
 GASVX1_FILE_NAME = TEMPDIR + "/gasvx1.dat"
@@ -38,6 +39,8 @@ class TestVelocity(unittest.TestCase):
         output.nghx = 1
         output.nghy = 3
         output.nghz = 1
+        output.dtype = dtype(float64)
+        output.grids = Grids(output)
 
         cls.gasvx1_file = tempfile.NamedTemporaryFile(
             delete=False, mode="w+b", suffix=".dat"
@@ -149,6 +152,8 @@ class TestVelocity(unittest.TestCase):
         assert_array_equal(self.velocity_z._xdata, xdata_expected_z)
         assert_array_equal(self.velocity_z._ydata, ydata_expected_z)
         assert_array_equal(self.velocity_z._zdata, zdata_expected_z)
+        self.assertEqual(self.velocity_x._grid, (self.output.grids, "x"))
+        self.assertEqual(self.velocity_z._grid, (self.output.grids, "z"))
 
     def test_get_2D_cartesian_plot_data(self) -> None:
         """Test Velocity's _get_2D_cartesian_plot_data method."""
@@ -815,3 +820,48 @@ class TestVelocity(unittest.TestCase):
         """Test Field's data property."""
         expected_x = GASVX1.reshape((2, 3, 1), order="F")
         assert_array_equal(self.velocity_x.data, expected_x)
+
+    def test_centred(self) -> None:
+        """Test Field's centred method."""
+        data_x = self.velocity_x.data
+        centred_x = self.velocity_x.centred()
+        self.assertEqual(centred_x._grid, (self.output.grids, None))
+        assert_array_equal(centred_x.x, array([-0.785, 0.785]))
+        assert_array_equal(centred_x.y, self.velocity_x.y)
+        assert_array_equal(centred_x.data, 0.5 * (data_x + roll(data_x, -1, axis=0)))
+
+        X, Y, xlabel, ylabel = centred_x._get_1D_cylindrical_plot_data(
+            "polar", "x", (0, 0)
+        )
+        assert_array_equal(X, array([-0.785, 0.785]))
+        assert_array_equal(Y, centred_x.data[:, 0, 0])
+        self.assertEqual(xlabel, r"$\phi$")
+        self.assertEqual(ylabel, r"$v_\phi$")
+
+        data_y = self.velocity_y.data
+        self.output.get_opt.return_value = False
+        with unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 2):
+            centred_y = self.velocity_y.centred()
+            upper = concatenate((data_y[:, 1:], data_y[:, -1:]), axis=1)
+            assert_array_equal(centred_y.data, 0.5 * (data_y + upper))
+            self.output.get_opt.assert_called_with("PERIODICY")
+
+            self.output.get_opt.return_value = True
+            upper = roll(data_y, -1, axis=1)
+            assert_array_equal(self.velocity_y.centred().data, 0.5 * (data_y + upper))
+        self.output.get_opt.reset_mock(return_value=True)
+
+        kinetic = centred_x**2 + centred_y**2
+        assert_array_equal(kinetic.data, centred_x.data**2 + centred_y.data**2)
+
+        values = centred_x._data
+        self.assertIs(self.velocity_y.centred(out=centred_x), centred_x)
+        self.assertIs(centred_x._values, values)
+        assert_array_equal(centred_x.data, 0.5 * (data_y + upper))
+        out = empty((2, 3, 1))
+        self.assertIs(self.velocity_x.centred(out=out), out)
+        assert_array_equal(out, 0.5 * (data_x + roll(data_x, -1, axis=0)))
+        with self.assertRaises(Exception):
+            self.velocity_x.centred(out=self.velocity_y.astype(float64))
+        with self.assertRaises(ValueError):
+            centred_x.centred()
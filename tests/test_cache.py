@@ -0,0 +1,82 @@
+"""Tests for cache module."""
+
+import pickle
+import unittest
+
+from fargonaut.cache import Cache
+
+
+class TestCache(unittest.TestCase):
+    """Tests for Cache class."""
+
+    def setUp(self) -> None:
+        """Create cache fixture."""
+        self.cache = Cache(100)
+
+    def tearDown(self) -> None:
+        """Destroy cache fixture."""
+        del self.cache
+
+    def test_init(self) -> None:
+        """Test Cache's __init__ method."""
+        self.assertEqual(self.cache.max_bytes, 100)
+        self.assertEqual(self.cache.nbytes, 0)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(
+            (self.cache.hits, self.cache.misses, self.cache.evictions), (0, 0, 0)
+        )
+
+    def test_get(self) -> None:
+        """Test Cache's get method."""
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", 1, 10)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_put(self) -> None:
+        """Test Cache's put method."""
+        self.cache.put("a", 1, 40)
+        self.cache.put("b", 2, 40)
+        self.cache.get("a")
+        self.cache.put("c", 3, 40)
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.cache.nbytes, 80)
+        self.assertEqual(self.cache.evictions, 1)
+
+        self.cache.put("a", 4, 50)
+        self.assertEqual(self.cache.get("a"), 4)
+        self.assertEqual(self.cache.nbytes, 90)
+
+        self.cache.put("d", 5, 101)
+        self.assertNotIn("d", self.cache)
+        self.assertEqual(self.cache.nbytes, 90)
+
+    def test_evict(self) -> None:
+        """Test Cache's evict method."""
+        self.cache.put("a", 1, 40)
+        self.cache.evict("a")
+        self.cache.evict("b")
+        self.assertNotIn("a", self.cache)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_clear(self) -> None:
+        """Test Cache's clear method."""
+        self.cache.put("a", 1, 40)
+        self.cache.put("b", 2, 40)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_pickle(self) -> None:
+        """Test pickling a Cache."""
+        self.cache.put("a", 1, 40)
+        self.cache.get("a")
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual((cache.nbytes, cache.hits), (40, 2))
+        cache.put("b", 2, 80)
+        self.assertNotIn("a", cache)
+        self.assertIn("a", self.cache)
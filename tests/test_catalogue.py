@@ -0,0 +1,152 @@
+"""Tests for catalogue module."""
+
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from fargonaut.catalogue import INDEX_FILE_NAME, Catalogue
+from fargonaut.output import Output
+
+SUMMARY0 = "stuff\n==\nCOMPILATION OPTION SECTION:\n==\n{opts}\nmore stuff\n"
+VARIABLES = "COORDINATES\t{coordinates}\nNX\t{nx}\nNY\t4\nNZ\t1\n"
+
+
+def write_output(path: Path, coordinates: str, nx: int, opts: str) -> None:
+    """Write the metadata files of an output.
+
+    Args:
+        path (Path): The path to the output directory
+        coordinates (str): The coordinate system of the output
+        nx (int): The number of cells in the x dimension
+        opts (str): The compilation options of the output
+    """
+    path.mkdir(parents=True)
+    (path / "variables.par").write_text(
+        VARIABLES.format(coordinates=coordinates, nx=nx)
+    )
+    (path / "summary0.dat").write_text(SUMMARY0.format(opts=opts))
+
+
+class TestCatalogue(unittest.TestCase):
+    """Tests for Catalogue class."""
+
+    def setUp(self) -> None:
+        """Create a directory tree of outputs."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        write_output(self.root / "disc" / "mhd", "cylindrical", 1024, "-DX -DY -DMHD")
+        write_output(self.root / "disc" / "hydro", "cylindrical", 512, "-DX -DY")
+        write_output(self.root / "box", "cartesian", 2048, "-DX -DY -DMHD")
+        (self.root / "notes").mkdir()
+        for num in range(3):
+            (self.root / "box" / f"gasdens{num}.dat").touch()
+        (self.root / "box" / "gasvx1.dat").touch()
+        (self.root / "box" / "gasvx2_0.dat").touch()
+        (self.root / "box" / "gasvx2_1.dat").touch()
+        (self.root / "box" / "domain_x.dat").touch()
+        self.catalogue = Catalogue(self.root)
+
+    def tearDown(self) -> None:
+        """Delete the directory tree of outputs."""
+        self.tempdir.cleanup()
+
+    def test_init(self) -> None:
+        """Test Catalogue's __init__ method."""
+        self.assertEqual(self.catalogue.root, self.root)
+        self.assertEqual(self.catalogue.index, self.root / INDEX_FILE_NAME)
+        self.assertTrue(self.catalogue.index.exists())
+
+        with unittest.mock.patch.object(Catalogue, "update") as update_mock:
+            catalogue = Catalogue(self.root)
+        update_mock.assert_not_called()
+        self.assertEqual(len(catalogue), 3)
+
+        index = self.root / "notes" / "index.json"
+        catalogue = Catalogue(self.root, index)
+        self.assertEqual(catalogue.index, index)
+        self.assertTrue(index.exists())
+
+        # A corrupt index is rebuilt
+        for contents in ("{", '{"records": {}}', "[]", '{"outputs": []}'):
+            index.write_text(contents)
+            catalogue = Catalogue(self.root, index)
+            self.assertEqual(len(catalogue), 3)
+            with open(index) as fid:
+                self.assertEqual(len(json.load(fid)["outputs"]), 3)
+
+        # An index which cannot be written is kept in memory
+        index = self.root / "missing" / "index.json"
+        catalogue = Catalogue(self.root, index)
+        self.assertEqual(len(catalogue), 3)
+        self.assertFalse(index.parent.exists())
+
+    def test_iter(self) -> None:
+        """Test Catalogue's __iter__ method."""
+        outputs = list(self.catalogue)
+        self.assertEqual(
+            [output._directory for output in outputs],
+            [self.root / "box", self.root / "disc/hydro", self.root / "disc/mhd"],
+        )
+        for output in outputs:
+            self.assertIsInstance(output, Output)
+        self.assertEqual(outputs[0].nx, 2048)
+        self.assertTrue(outputs[0].get_opt("MHD"))
+
+    def test_query(self) -> None:
+        """Test Catalogue's query method."""
+        self.assertEqual(len(self.catalogue.query()), 3)
+        outputs = self.catalogue.query(
+            lambda output: (
+                output.coordinate_system == "cylindrical"
+                and output.nx >= 1024
+                and output.get_opt("MHD")
+            )
+        )
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(outputs[0]._directory, self.root / "disc/mhd")
+
+    def test_snapshots(self) -> None:
+        """Test Catalogue's snapshots method."""
+        self.assertEqual(self.catalogue.snapshots("box", "gasdens"), [0, 1, 2])
+        self.assertEqual(self.catalogue.snapshots(self.root / "box", "gasvx"), [1, 2])
+        self.assertEqual(self.catalogue.snapshots("box", "gasvy"), [])
+        output = self.catalogue.query(lambda output: output.nx == 512)[0]
+        self.assertEqual(self.catalogue.snapshots(output, "gasdens"), [])
+        with self.assertRaises(KeyError):
+            self.catalogue.snapshots("notes", "gasdens")
+
+    def test_update(self) -> None:
+        """Test Catalogue's update method."""
+        with unittest.mock.patch("fargonaut.catalogue.Output") as output_mock:
+            self.catalogue.update()
+        output_mock.assert_not_called()
+
+        (self.root / "box" / "gasdens3.dat").touch()
+        os.utime(self.root / "box", ns=(0, 0))
+        write_output(self.root / "notes" / "new", "spherical", 64, "-DX")
+        self.catalogue.update()
+        self.assertEqual(len(self.catalogue), 4)
+        self.assertEqual(self.catalogue.snapshots("box", "gasdens"), [0, 1, 2, 3])
+
+        (self.root / "disc" / "hydro" / "variables.par").unlink()
+        self.catalogue.update()
+        self.assertEqual(len(self.catalogue), 3)
+        catalogue = Catalogue(self.root)
+        self.assertEqual(len(catalogue), 3)
+
+    def test_update_invalid(self) -> None:
+        """Test Catalogue's update method with invalid outputs."""
+        write_output(self.root / "bad" / "summary", "cartesian", 8, "-DX")
+        (self.root / "bad" / "summary" / "summary0.dat").write_text("stuff\n")
+        write_output(self.root / "bad" / "variables", "cartesian", 8, "-DX")
+        (self.root / "bad" / "variables" / "variables.par").write_text("NX 8 16\n")
+        self.catalogue.update()
+        self.assertEqual(len(self.catalogue), 4)
+        output = self.catalogue.query(lambda output: output.nx == 8)[0]
+        self.assertEqual(output._directory, self.root / "bad" / "summary")
+        with unittest.mock.patch.object(Output, "_read_opts") as read_opts_mock:
+            self.assertFalse(output.get_opt("MHD"))
+        read_opts_mock.assert_not_called()
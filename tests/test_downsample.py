@@ -0,0 +1,57 @@
+"""Tests for downsample module."""
+
+import unittest
+import unittest.mock
+
+from numpy import arange, array, meshgrid
+from numpy.testing import assert_array_equal
+
+from fargonaut.downsample import downsample, resolution
+
+
+class TestDownsample(unittest.TestCase):
+    """Tests for downsample module functions."""
+
+    def setUp(self) -> None:
+        """Create slice fixture."""
+        self.X, self.Y = meshgrid(arange(8.0), arange(4.0), indexing="ij")
+        self.C = arange(21.0).reshape((7, 3))
+
+    def test_downsample(self) -> None:
+        """Test the downsample function."""
+        X, Y, C = downsample(self.X, self.Y, self.C, (3, 3))
+        assert_array_equal(X, self.X[[0, 3, 6, 7], :])
+        assert_array_equal(Y, self.Y[[0, 3, 6, 7], :])
+        assert_array_equal(
+            C, array([self.C[0:3].mean(0), self.C[3:6].mean(0), self.C[6]])
+        )
+
+        X, Y, C = downsample(self.X, self.Y, self.C, (7, 2), "min")
+        assert_array_equal(X, self.X[:, [0, 2, 3]])
+        assert_array_equal(C, self.C[:, [0, 2]])
+
+        X, Y, C = downsample(self.X, self.Y, self.C, (4, 1), "max")
+        assert_array_equal(X, self.X[[0, 2, 4, 6, 7]][:, [0, 3]])
+        assert_array_equal(C, array([[5.0], [11.0], [17.0], [20.0]]))
+
+        mask = self.C % 2 == 0
+        for values in (mask, self.C.astype(int)):
+            X, Y, C = downsample(self.X, self.Y, values, (3, 3))
+            assert_array_equal(
+                C, array([values[0:3].mean(0), values[3:6].mean(0), values[6]])
+            )
+
+        X, Y, C = downsample(self.X, self.Y, self.C, (7, 3))
+        self.assertIs(X, self.X)
+        self.assertIs(Y, self.Y)
+        self.assertIs(C, self.C)
+
+        with self.assertRaises(ValueError):
+            downsample(self.X, self.Y, self.C, (3, 3), "median")
+
+    def test_resolution(self) -> None:
+        """Test the resolution function."""
+        axs = unittest.mock.Mock()
+        axs.get_window_extent.return_value.width = 496.0
+        axs.get_window_extent.return_value.height = 369.6
+        self.assertEqual(resolution(axs), 496)
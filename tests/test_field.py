@@ -1,12 +1,31 @@
 """Tests for field module."""
 
+import os
+import tempfile
 import unittest
 import unittest.mock
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Event
+from time import sleep
 
-from numpy import array
+from numpy import (
+    arange,
+    array,
+    dtype,
+    float32,
+    float64,
+    memmap,
+    multiply,
+    shares_memory,
+)
 from numpy.testing import assert_array_equal
+from numpy.typing import NDArray
 
-from fargonaut.field import DerivedField, Field
+from fargonaut.field import MAX_FUSED_DEPTH, DerivedField, Field, _blocks
+from fargonaut.fields.density import Density
+from fargonaut.fields.velocity import Velocity
 
 
 class TestField(unittest.TestCase):
@@ -18,11 +37,13 @@ class TestField(unittest.TestCase):
         self.field._output.nx = 1
         self.field._output.ny = 2
         self.field._output.nz = 3
+        self.field._output.dtype = dtype(float64)
         self.field._xdata = array([0.1, 0.2, 0.3])
         self.field._ydata = array([0.4, 0.5, 0.6])
         self.field._zdata = array([0.7, 0.8, 0.9])
         self.field._raw = array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
         self.field._process_data = Field._process_data
+        self.field._read = Field._read
 
     def tearDown(self) -> None:
         """Destroy field fixture."""
@@ -44,20 +65,285 @@ class TestField(unittest.TestCase):
             ),
         )
 
+    def test_read(self) -> None:
+        """Test Field's _read method."""
+        data_file = tempfile.NamedTemporaryFile(delete=False, suffix=".dat")
+        self.field._raw.tofile(data_file)
+        data_file.close()
+
+        self.field._mmap = False
+        raw = self.field._read(self.field, data_file.name)
+        self.assertNotIsInstance(raw, memmap)
+        assert_array_equal(raw, self.field._raw)
+
+        self.field._mmap = True
+        raw = self.field._read(self.field, data_file.name)
+        self.assertIsInstance(raw, memmap)
+        self.assertFalse(raw.flags.writeable)
+        assert_array_equal(raw, self.field._raw)
+
+        del raw
+        os.remove(data_file.name)
+
+        data_file = tempfile.NamedTemporaryFile(delete=False, suffix=".dat")
+        self.field._raw.astype(float32).tofile(data_file)
+        data_file.close()
+
+        self.field._output.dtype = dtype(float32)
+        for mmap in (False, True):
+            self.field._mmap = mmap
+            raw = self.field._read(self.field, data_file.name)
+            self.assertEqual(raw.dtype, float32)
+            assert_array_equal(raw, self.field._raw.astype(float32))
+
+        del raw
+        os.remove(data_file.name)
+
+    def test_astype(self) -> None:
+        """Test Field's astype method."""
+        base = unittest.mock.Mock(spec=Field)
+        base.symbol = "a"
+        base._output = self.field._output
+        base._xdata = self.field._xdata
+        base._ydata = self.field._ydata
+        base._zdata = self.field._zdata
+        base._raw = self.field._raw.astype(float32)
+        base._data = base._raw.reshape((1, 2, 3), order="F")
+        base._operand = partial(Field._operand, base)
+
+        self.assertEqual(Field.__pow__(base, 2).data.dtype, float32)
+        result = Field.astype(base, float64)
+        self.assertEqual(result.data.dtype, float64)
+        assert_array_equal(result.raw, base._raw)
+        self.assertEqual((result**2).data.dtype, float64)
+
 
 class TestDerivedField(unittest.TestCase):
     """Tests for DerivedField class."""
 
     def setUp(self) -> None:
-        """Create field fixture."""
+        """Create field fixtures."""
         self.field = unittest.mock.Mock()
         self.field.set_symbol = DerivedField.set_symbol
+        self.base = unittest.mock.Mock(spec=Field)
+        self.base.symbol = "a"
+        self.base._output = unittest.mock.Mock()
+        self.base._xdata = arange(4.0)
+        self.base._ydata = arange(3.0)
+        self.base._zdata = arange(2.0)
+        self.base._raw = arange(24.0)
+        self.base._data = self.base._raw.reshape((4, 3, 2), order="F")
+        self.base._operand = partial(Field._operand, self.base)
 
     def tearDown(self) -> None:
-        """Destroy field fixture."""
+        """Destroy field fixtures."""
         del self.field
+        del self.base
 
     def test_set_symbol(self) -> None:
         """Test DerivedField's set_symbol method."""
         self.field.set_symbol(self.field, "x")
         self.assertEqual(self.field.symbol, "x")
+
+    @unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 6)
+    def test_evaluate(self) -> None:
+        """Test DerivedField's _evaluate method."""
+        base = self.base
+
+        intermediate = Field.__mul__(base, base)
+        result = intermediate + base
+        self.assertIsNone(result._values)
+
+        assert_array_equal(result._data, base._data**2 + base._data)
+        self.assertTrue(result._data.flags.f_contiguous)
+        self.assertIsNone(intermediate._values)
+        self.assertEqual(result._operands, ())
+
+        assert_array_equal(result._raw, base._raw**2 + base._raw)
+        self.assertTrue(shares_memory(result._raw, result._data))
+
+        derived = DerivedField(base, multiply, (base, 2.0))
+        assert_array_equal(derived._raw, 2.0 * base._raw)
+
+    @unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 6)
+    def test_chain(self) -> None:
+        """Test DerivedField's evaluation of long chains of operations."""
+        base = self.base
+
+        total = Field.astype(base, float64)
+        refs = [weakref.ref(total)]
+        for _ in range(5000):
+            total = total + base
+            refs.append(weakref.ref(total))
+        self.assertLessEqual(total._depth, MAX_FUSED_DEPTH)
+        self.assertLessEqual(sum(ref() is not None for ref in refs), MAX_FUSED_DEPTH)
+        assert_array_equal(total._data, 5001 * base._data)
+
+        # Fields shared by several fields in a chain are evaluated once per block
+        calls = []
+
+        def double(lhs: NDArray, rhs: NDArray) -> NDArray:
+            calls.append(None)
+            return lhs + rhs
+
+        total = DerivedField(base, float64, (base,))
+        for _ in range(MAX_FUSED_DEPTH - 1):
+            total = DerivedField(base, double, (total, total))
+        self.assertEqual(total._depth, MAX_FUSED_DEPTH)
+        assert_array_equal(total._data, 2 ** (MAX_FUSED_DEPTH - 1) * base._data)
+        blocks = len(list(_blocks(base._data.shape)))
+        self.assertEqual(len(calls), (MAX_FUSED_DEPTH - 1) * blocks)
+
+    @unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 6)
+    def test_evaluate_threads(self) -> None:
+        """Test DerivedField's _evaluate method from concurrent threads."""
+        base = self.base
+        started = Event()
+
+        def operation(values: NDArray) -> NDArray:
+            started.set()
+            sleep(0.01)
+            return 2 * values
+
+        derived = DerivedField(base, operation, (base,))
+        later = derived + 1.0
+        with ThreadPoolExecutor(3) as executor:
+            first = executor.submit(lambda: derived._data)
+            started.wait()
+            results = [
+                executor.submit(lambda: derived._data),
+                executor.submit(lambda: later._data),
+            ]
+            assert_array_equal(first.result(), 2 * base._data)
+            assert_array_equal(results[0].result(), 2 * base._data)
+            assert_array_equal(results[1].result(), 2 * base._data + 1)
+
+    def test_getstate(self) -> None:
+        """Test DerivedField's __getstate__ and __setstate__ methods."""
+        base = self.base
+
+        doubled = Field.astype(base, float64) * 2
+        state = doubled._operands[0].__getstate__()
+        self.assertNotIn("_lock", state)
+        self.assertNotIn("_dependents", state)
+        acc = object.__new__(type(doubled))
+        acc.__setstate__(state)
+        state = doubled.__getstate__()
+        state["_operands"] = (acc, *state["_operands"][1:])
+        copied = object.__new__(type(doubled))
+        copied.__setstate__(state)
+        self.assertIsNot(copied._lock, doubled._lock)
+        self.assertIn(copied, acc._dependents)
+        acc += 1
+        assert_array_equal(copied._data, 2 * base._data)
+        assert_array_equal(doubled._data, 2 * base._data)
+
+    @unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 6)
+    def test_inplace(self) -> None:
+        """Test DerivedField's in-place operators and out arguments."""
+        base = self.base
+        base._raw = arange(1.0, 25.0, dtype=float32)
+        base._data = base._raw.reshape((4, 3, 2), order="F")
+
+        acc = Field.astype(base, float64)
+        acc.set_symbol("b")
+        values = acc._data
+        acc += base
+        acc *= 3
+        acc -= base
+        acc /= array([1.0, 2.0, 4.0])
+        acc **= 2
+        self.assertIs(acc._values, values)
+        self.assertEqual(acc._data.dtype, float64)
+        self.assertEqual(acc.symbol, "b")
+        expected = ((5 * base._data.astype(float64)) / array([1, 2, 4])[:, None]) ** 2
+        assert_array_equal(acc._data, expected)
+
+        out = Field.astype(base, float64)
+        values = out._data
+        self.assertIs(acc.multiply(acc + base, out=out), out)
+        self.assertIs(out._values, values)
+        assert_array_equal(out._data, expected * (expected + base._data))
+        self.assertIs(acc.power(0.5, out=acc), acc)
+        assert_array_equal(acc._data, expected**0.5)
+        self.assertIsInstance(acc.add(base), DerivedField)
+        self.assertIsNot(acc.subtract(1.0), acc)
+        with self.assertRaises(Exception):
+            acc.divide(base, out=base)
+
+    def test_inplace_dependents(self) -> None:
+        """Test DerivedField's in-place operators keep dependent fields' values."""
+        base = self.base
+
+        acc = Field.astype(base, float64)
+        doubled = acc * 2
+        shifted = doubled + 1
+        acc += 1
+        assert_array_equal(doubled._data, 2 * base._data)
+        assert_array_equal(shifted._data, 2 * base._data + 1)
+        assert_array_equal(acc._data, base._data + 1)
+
+        copied = acc + 0
+        scaled = acc * 1
+        (acc * 3).add(base, out=acc)
+        assert_array_equal(copied._data, base._data + 1)
+        assert_array_equal(scaled._data, base._data + 1)
+        assert_array_equal(acc._data, 4 * base._data + 3)
+
+    def test_new(self) -> None:
+        """Test DerivedField's __new__ method."""
+        density = unittest.mock.Mock(spec=Density)
+        velocity = unittest.mock.Mock(spec=Velocity)
+        for base in (density, velocity):
+            base.symbol = "a"
+            base._output = unittest.mock.Mock()
+            base._xdata = base._ydata = base._zdata = arange(2.0)
+        velocity._dimension = "x"
+        with ThreadPoolExecutor(4) as executor:
+            fields = list(
+                executor.map(
+                    lambda base: DerivedField(base, multiply, (base, 2.0)),
+                    [density, velocity] * 50,
+                )
+            )
+        for field in fields[::2]:
+            self.assertIs(type(field), type(fields[0]))
+        for field in fields[1::2]:
+            self.assertIs(type(field), type(fields[1]))
+            self.assertEqual(field._dimension, "x")
+        self.assertEqual(type(fields[0]).__name__, "DerivedDensity")
+        self.assertIs(
+            type(fields[0])._get_2D_cartesian_plot_data,
+            Density._get_2D_cartesian_plot_data,
+        )
+        self.assertIs(
+            type(fields[1])._get_1D_spherical_plot_data,
+            Velocity._get_1D_spherical_plot_data,
+        )
+        self.assertIs(type(fields[1]).plot, Field.plot)
+        self.assertNotIn("_get_2D_cartesian_plot_data", vars(DerivedField))
+
+        derived = DerivedField(fields[0], multiply, (fields[0], 2.0))
+        self.assertIs(type(derived), type(fields[0]))
+        self.assertIsInstance(derived, DerivedField)
+
+    @unittest.mock.patch("fargonaut.field.BLOCK_SIZE", 8)
+    def test_blocks(self) -> None:
+        """Test the _blocks function."""
+        self.assertListEqual(
+            list(_blocks((20,))), [(slice(0, 8),), (slice(8, 16),), (slice(16, 24),)]
+        )
+        self.assertListEqual(
+            list(_blocks((4, 3, 2))),
+            [
+                (slice(None), slice(None), slice(0, 1)),
+                (slice(None), slice(None), slice(1, 2)),
+            ],
+        )
+        self.assertListEqual(
+            list(_blocks((2, 6, 1))),
+            [
+                (slice(None), slice(0, 4), slice(None)),
+                (slice(None), slice(4, 8), slice(None)),
+            ],
+        )
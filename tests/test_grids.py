@@ -0,0 +1,101 @@
+"""Tests for grids module."""
+
+import unittest
+import unittest.mock
+
+from numpy import array, cos, sin
+from numpy.testing import assert_array_equal
+
+from fargonaut.grids import Grids
+
+
+class TestGrids(unittest.TestCase):
+    """Tests for Grids class."""
+
+    def setUp(self) -> None:
+        """Create a mock output and grid registry fixture."""
+        output = unittest.mock.Mock()
+        output._xdomain = array([-3.0, -1.0, 1.0, 3.0])
+        output._ydomain = array([0.0, 1.0, 2.0, 3.0, 4.0])
+        output._zdomain = array([-1.0, 0.0, 1.0])
+        output.nghx = 0
+        output.nghy = 1
+        output.nghz = 0
+        self.grids = Grids(output)
+
+    def tearDown(self) -> None:
+        """Destroy grid registry fixture."""
+        del self.grids
+
+    def test_coordinates(self) -> None:
+        """Test Grids's coordinates method."""
+        x, y, z = self.grids.coordinates()
+        assert_array_equal(x, array([-2.0, 0.0, 2.0]))
+        assert_array_equal(y, array([1.5, 2.5]))
+        assert_array_equal(z, array([-0.5, 0.5]))
+        self.assertFalse(x.flags.writeable)
+        self.assertIs(self.grids.coordinates()[0], x)
+
+        x, y, z = self.grids.coordinates("x")
+        assert_array_equal(x, array([-3.0, -1.0, 1.0]))
+        assert_array_equal(y, array([1.5, 2.5]))
+
+        x, y, z = self.grids.coordinates("y")
+        assert_array_equal(y, array([1.0, 2.0]))
+
+    def test_edges(self) -> None:
+        """Test Grids's edges method."""
+        x, y, z = self.grids.edges()
+        assert_array_equal(x, array([-3.0, -1.0, 1.0, 3.0]))
+        assert_array_equal(y, array([1.0, 2.0, 3.0]))
+        assert_array_equal(z, array([-1.0, 0.0, 1.0]))
+        self.assertFalse(y.flags.writeable)
+
+    def test_plane(self) -> None:
+        """Test Grids's plane method."""
+        coord_map = self.grids.plane("cylindrical", "polar", "xy", 1)
+        X, xlabel = coord_map["x"]
+        Y, ylabel = coord_map["y"]
+        Z, _ = coord_map["z"]
+        assert_array_equal(X, array([[-3.0] * 3, [-1.0] * 3, [1.0] * 3, [3.0] * 3]))
+        assert_array_equal(Y, array([[1.0, 2.0, 3.0]] * 4))
+        assert_array_equal(Z, array([[0.0] * 3] * 4))
+        self.assertEqual((xlabel, ylabel), (r"$\phi$", "$r$"))
+        self.assertFalse(X.flags.writeable)
+        self.assertIs(self.grids.plane("cylindrical", "polar", "xy", 1), coord_map)
+        self.assertEqual(self.grids.cache.hits, 1)
+
+        coord_map = self.grids.plane("cylindrical", "cartesian", "yz", -1)
+        X, xlabel = coord_map["y"]
+        assert_array_equal(X, array([[1.0] * 3, [2.0] * 3, [3.0] * 3]) * sin(3.0))
+        self.assertEqual(xlabel, "$y$")
+
+        coord_map = self.grids.plane("spherical", "cartesian", "xz", 0)
+        X, _ = coord_map["x"]
+        phi = array([[-3.0] * 3, [-1.0] * 3, [1.0] * 3, [3.0] * 3])
+        theta = array([[-1.0, 0.0, 1.0]] * 4)
+        assert_array_equal(X, 1.0 * cos(phi) * sin(theta))
+
+        with self.assertRaises(NotImplementedError):
+            self.grids.plane("cartesian", "polar", "xy", 0)
+        with self.assertRaises(ValueError):
+            self.grids.plane("cylindrical", "invalid", "xy", 0)
+        with self.assertRaises(ValueError):
+            self.grids.plane("invalid", "polar", "xy", 0)
+        with self.assertRaises(ValueError):
+            self.grids.plane("cylindrical", "polar", "ij", 0)
+
+    def test_line(self) -> None:
+        """Test Grids's line method."""
+        coord_map = self.grids.line("cartesian", None, "cartesian", "x", (0, 1))
+        X, xlabel = coord_map["x"]
+        assert_array_equal(X, array([-2.0, 0.0, 2.0]))
+        self.assertEqual(xlabel, "$x$")
+
+        coord_map = self.grids.line("cylindrical", "y", "polar", "y", (2, 0))
+        X, xlabel = coord_map["y"]
+        assert_array_equal(X, array([1.0, 2.0]))
+        self.assertEqual(xlabel, "$r$")
+
+        with self.assertRaises(ValueError):
+            self.grids.line("cylindrical", None, "polar", "k", (0, 0))
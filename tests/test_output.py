@@ -1,12 +1,15 @@
 """Tests for output module."""
 
 import os
+import pickle
 import tempfile
 import unittest
 import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 
-from numpy import array
+from numpy import arange, array, float32, float64, fromfile
 from numpy.testing import assert_array_equal
 
 from fargonaut.output import Output
@@ -18,6 +21,9 @@ DOMAIN_Y_FILE_NAME = TEMPDIR + "/domain_y.dat"
 DOMAIN_Z_FILE_NAME = TEMPDIR + "/domain_z.dat"
 SUMMARY0_FILE_NAME = TEMPDIR + "/summary0.dat"
 VARIABLES_FILE_NAME = TEMPDIR + "/variables.par"
+GASDENS7_FILE_NAME = TEMPDIR + "/gasdens7.dat"
+DOMAINS_CACHE_FILE_NAME = TEMPDIR + "/.domains.fargonaut"
+MISSING_DIRECTORY = TEMPDIR + "/missing_output"
 
 DOMAIN_X = "-3.14\n-1.57\n0.0\n1.57\n3.14\n"
 DOMAIN_Y = "1.0\n2.0\n3.0\n"
@@ -78,6 +84,7 @@ class TestOutput(unittest.TestCase):
         os.remove(DOMAIN_Z_FILE_NAME)
         os.remove(SUMMARY0_FILE_NAME)
         os.remove(VARIABLES_FILE_NAME)
+        os.remove(DOMAINS_CACHE_FILE_NAME)
 
     def setUp(self) -> None:
         """Create output fixture."""
@@ -90,6 +97,34 @@ class TestOutput(unittest.TestCase):
     def test_init(self) -> None:
         """Test Output's __init__ method."""
         self.assertEqual(self.output._directory, Path(TEMPDIR))
+        for name in ("_opts", "_vars", "_xdomain", "_ydomain", "_zdomain"):
+            self.assertNotIn(name, vars(self.output))
+
+    def test_getattr(self) -> None:
+        """Test Output's __getattr__ method."""
+        self.assertEqual(self.output._vars["NX"], "5")
+        self.assertIn("_vars", vars(self.output))
+        self.assertNotIn("_opts", vars(self.output))
+        self.assertNotIn("_xdomain", vars(self.output))
+
+        assert_array_equal(self.output._ydomain, array([1.0, 2.0, 3.0]))
+        for name in ("_xdomain", "_ydomain", "_zdomain"):
+            self.assertIn(name, vars(self.output))
+        self.assertNotIn("_opts", vars(self.output))
+
+        del self.output._vars
+        self.assertEqual(self.output.nx, 5)
+        with self.assertRaises(AttributeError):
+            self.output._undefined
+
+    def test_peek(self) -> None:
+        """Test Output's peek method."""
+        output = Output.peek(TEMPDIR)
+        self.assertIn("_vars", vars(output))
+        self.assertNotIn("_opts", vars(output))
+        self.assertEqual(output.coordinate_system, "cylindrical")
+        with self.assertRaises(FileNotFoundError):
+            Output.peek(MISSING_DIRECTORY)
 
     def test_read_domains(self) -> None:
         """Test Output's _read_domains method."""
@@ -101,11 +136,38 @@ class TestOutput(unittest.TestCase):
         assert_array_equal(self.output._ydomain, ydomain)
         assert_array_equal(self.output._zdomain, zdomain)
 
+    def test_read_domains_cache(self) -> None:
+        """Test Output's _read_domains method uses the domains cache file."""
+        self.output._read_domains()
+        self.assertTrue(os.path.exists(DOMAINS_CACHE_FILE_NAME))
+        output = Output(TEMPDIR)
+        with unittest.mock.patch("fargonaut.output.fromfile") as fromfile_mock:
+            fromfile_mock.side_effect = fromfile
+            output._read_domains()
+        self.assertEqual(fromfile_mock.call_count, 2)
+        assert_array_equal(output._xdomain, self.output._xdomain)
+        assert_array_equal(output._ydomain, self.output._ydomain)
+        assert_array_equal(output._zdomain, self.output._zdomain)
+
+        with open(DOMAIN_Z_FILE_NAME, "w") as fid:
+            fid.write("-2.0\n0.0\n2.0\n")
+        output = Output(TEMPDIR)
+        assert_array_equal(output._zdomain, array([-2.0, 0.0, 2.0]))
+        with open(DOMAIN_Z_FILE_NAME, "w") as fid:
+            fid.write(DOMAIN_Z)
+        output = Output(TEMPDIR)
+        assert_array_equal(output._zdomain, array([-1.0, 0.0, 1.0]))
+
     def test_read_opts(self) -> None:
         """Test Output's _read_opts method."""
         opts = ("X", "Y", "ISOTHERMAL", "CYLINDRICAL")
         self.assertTupleEqual(self.output._opts, opts)
 
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "summary0.dat").write_text("stuff\nmore stuff\n")
+            with self.assertRaises(ValueError):
+                Output(directory)._read_opts()
+
     def test_read_vars(self) -> None:
         """Test Output's _read_vars method."""
         variables = {
@@ -132,9 +194,8 @@ class TestOutput(unittest.TestCase):
         self.assertEqual(self.output.get_opt("ISOTHERMAL"), True)
         self.assertEqual(self.output.get_opt("PARALLEL"), False)
 
-        del self.output._opts
-        with self.assertRaises(AttributeError):
-            self.output.get_opt("PARALLEL")
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).get_opt("PARALLEL")
 
     @unittest.mock.patch("fargonaut.output.Velocity")
     @unittest.mock.patch("fargonaut.output.MagneticField")
@@ -145,27 +206,307 @@ class TestOutput(unittest.TestCase):
     ) -> None:
         """Test Output's get_field method."""
         self.output.get_field("gasdens", 2)
-        density_mock.assert_called_once_with(self.output, 2)
+        density_mock.assert_called_once_with(self.output, 2, mmap=False)
         self.output.get_field("gasenergy", 3)
-        energy_mock.assert_called_once_with(self.output, 3)
+        energy_mock.assert_called_once_with(self.output, 3, mmap=False)
         self.output.get_field("gasvx", 4)
-        velocity_mock.assert_called_with(self.output, "x", 4)
+        velocity_mock.assert_called_with(self.output, "x", 4, mmap=False)
         self.output.get_field("gasvy", 5)
-        velocity_mock.assert_called_with(self.output, "y", 5)
+        velocity_mock.assert_called_with(self.output, "y", 5, mmap=False)
         self.output.get_field("gasvz", 6)
-        velocity_mock.assert_called_with(self.output, "z", 6)
+        velocity_mock.assert_called_with(self.output, "z", 6, mmap=False)
         self.assertEqual(velocity_mock.call_count, 3)
         self.output.get_field("bx", 7)
-        magnetic_field_mock.assert_called_with(self.output, "x", 7)
+        magnetic_field_mock.assert_called_with(self.output, "x", 7, mmap=False)
         self.output.get_field("by", 8)
-        magnetic_field_mock.assert_called_with(self.output, "y", 8)
+        magnetic_field_mock.assert_called_with(self.output, "y", 8, mmap=False)
         self.output.get_field("bz", 9)
-        magnetic_field_mock.assert_called_with(self.output, "z", 9)
+        magnetic_field_mock.assert_called_with(self.output, "z", 9, mmap=False)
         self.assertEqual(magnetic_field_mock.call_count, 3)
+        self.output.get_field("gasdens", 10, mmap=True)
+        density_mock.assert_called_with(self.output, 10, mmap=True)
 
         with self.assertRaises(NotImplementedError):
             self.output.get_field("undefinedfield", 25)
 
+    @unittest.mock.patch("fargonaut.output.Density")
+    def test_get_field_cached(self, density_mock) -> None:
+        """Test Output's get_field method with caching enabled."""
+        self.assertIsNone(self.output.cache)
+
+        density_mock.return_value.raw.nbytes = 48
+        self.output.enable_cache(100)
+        field = self.output.get_field("gasdens", 2)
+        self.assertIs(self.output.get_field("gasdens", 2), field)
+        density_mock.assert_called_once_with(self.output, 2, mmap=False)
+        self.assertEqual(self.output.cache.hits, 1)
+        self.assertEqual(self.output.cache.misses, 1)
+        self.assertEqual(self.output.cache.nbytes, 48)
+
+        self.output.cache.evict(("gasdens", 2))
+        self.output.get_field("gasdens", 2)
+        self.assertEqual(density_mock.call_count, 2)
+
+        self.output.disable_cache()
+        self.assertIsNone(self.output.cache)
+        self.output.get_field("gasdens", 2)
+        self.assertEqual(density_mock.call_count, 3)
+
+    def test_pickle(self) -> None:
+        """Test pickling an Output with caching enabled, and its fields."""
+        arange(45.0).tofile(f"{TEMPDIR}/gasdens31.dat")
+        self.output.enable_cache(1000)
+        field = self.output.get_field("gasdens", 31)
+        self.output.grids.plane("cylindrical", "polar", "xy", 1)
+        output = pickle.loads(pickle.dumps(self.output))
+        self.assertEqual(len(output.cache), 1)
+        self.assertEqual(len(output.grids.cache), len(self.output.grids.cache))
+        assert_array_equal(output.get_field("gasdens", 31).data, field.data)
+        self.assertEqual(output.cache.hits, 1)
+        assert_array_equal(pickle.loads(pickle.dumps(field)).data, field.data)
+
+        derived = field * 2 + field
+        evaluated = derived - 1
+        assert_array_equal(evaluated.data, 3 * field.data - 1)
+        copies = pickle.loads(pickle.dumps((derived, evaluated)))
+        for copy, original in zip(copies, (derived, evaluated), strict=True):
+            self.assertIs(type(copy), type(original))
+            self.assertEqual(copy.symbol, original.symbol)
+            assert_array_equal(copy.data, original.data)
+        os.remove(f"{TEMPDIR}/gasdens31.dat")
+
+    def test_get_field_prefetched(self) -> None:
+        """Test Output's get_field method with prefetching enabled."""
+        self.assertIsNone(self.output.prefetcher)
+        for num in (31, 32, 34, 35):
+            (arange(45.0) * num).tofile(f"{TEMPDIR}/gasenergy{num}.dat")
+
+        self.output.enable_prefetch(depth=2)
+        self.assertEqual(self.output.prefetcher.depth, 2)
+        for num in (31, 32, 34, 35):
+            field = self.output.get_field("gasenergy", num)
+            assert_array_equal(field.raw, arange(45.0) * num)
+        self.assertEqual(self.output.prefetcher.hits, 3)
+
+        self.output.enable_cache(1000)
+        self.output.get_field("gasenergy", 31)
+        self.assertIs(
+            self.output.get_field("gasenergy", 32),
+            self.output.get_field("gasenergy", 32),
+        )
+        self.output.get_field("gasenergy", 34, mmap=True)
+        self.assertEqual(self.output.prefetcher.hits, 4)
+
+        self.output.disable_prefetch()
+        self.assertIsNone(self.output.prefetcher)
+        for num in (31, 32, 34, 35):
+            os.remove(f"{TEMPDIR}/gasenergy{num}.dat")
+
+    def test_get_slice(self) -> None:
+        """Test Output's get_slice method."""
+        gasdens7 = arange(45.0)
+        gasdens7.tofile(GASDENS7_FILE_NAME)
+        data = gasdens7.reshape((5, 3, 3), order="F")
+
+        assert_array_equal(self.output.get_slice("gasdens", 7, z=1), data[:, :, 1])
+        assert_array_equal(self.output.get_slice("gasdens", 7, y=2), data[:, 2, :])
+        assert_array_equal(self.output.get_slice("gasdens", 7, x=-1), data[-1, :, :])
+        assert_array_equal(self.output.get_slice("gasdens", 7, y=0, z=2), data[:, 0, 2])
+
+        self.output._opts = ("FLOAT",)
+        gasdens7.astype(float32).tofile(GASDENS7_FILE_NAME)
+        plane = self.output.get_slice("gasdens", 7, z=1)
+        self.assertEqual(plane.dtype, float32)
+        assert_array_equal(plane, data[:, :, 1])
+
+        with self.assertRaises(ValueError):
+            self.output.get_slice("gasdens", 7)
+        with self.assertRaises(NotImplementedError):
+            self.output.get_slice("undefinedfield", 7, z=0)
+
+        os.remove(GASDENS7_FILE_NAME)
+
+    def test_scan(self) -> None:
+        """Test Output's scan method and inventory property."""
+        arange(45.0).tofile(f"{TEMPDIR}/bz21.dat")
+        arange(45.0).tofile(f"{TEMPDIR}/bz22.dat")
+        arange(30.0).tofile(f"{TEMPDIR}/bz23_0.dat")
+        arange(15.0).tofile(f"{TEMPDIR}/bz23_1.dat")
+
+        inventory = self.output.inventory
+        self.assertIs(self.output.inventory, inventory)
+        self.assertEqual(list(inventory["bz"]), [21, 22, 23])
+        mtime = os.stat(f"{TEMPDIR}/bz21.dat").st_mtime_ns
+        self.assertEqual(inventory["bz"][21], (360, mtime))
+        self.assertEqual(inventory["bz"][23][0], 360)
+        self.assertEqual(self.output.snapshots("bz"), [21, 22, 23])
+        with self.assertRaises(NotImplementedError):
+            self.output.snapshots("undefinedfield")
+
+        os.remove(f"{TEMPDIR}/bz23_0.dat")
+        os.remove(f"{TEMPDIR}/bz23_1.dat")
+        self.assertEqual(self.output.snapshots("bz"), [21, 22, 23])
+        self.output.scan()
+        self.assertEqual(self.output.snapshots("bz"), [21, 22])
+
+        datas = list(self.output.iter_field("bz"))
+        self.assertEqual(len(datas), 2)
+        raws = self.output.map_snapshots(attrgetter("raw"), "bz", pool="thread")
+        self.assertEqual(len(raws), 2)
+
+        os.remove(f"{TEMPDIR}/bz21.dat")
+        os.remove(f"{TEMPDIR}/bz22.dat")
+
+    def test_iter_field(self) -> None:
+        """Test Output's iter_field method."""
+        gasdens = [arange(45.0) * num for num in range(3)]
+        for num in range(3):
+            gasdens[num].tofile(f"{TEMPDIR}/gasdens{num + 11}.dat")
+
+        sums = list(self.output.iter_field("gasdens", range(11, 14), reduce=sum))
+        self.assertEqual(len(sums), 3)
+        for num in range(3):
+            assert_array_equal(
+                sums[num], gasdens[num].reshape((5, 3, 3), order="F").sum(axis=0)
+            )
+
+        datas = list(self.output.iter_field("gasdens", [13, 11]))
+        assert_array_equal(datas[0], gasdens[2].reshape((5, 3, 3), order="F"))
+        assert_array_equal(datas[1], gasdens[0].reshape((5, 3, 3), order="F"))
+
+        arange(44.0).tofile(f"{TEMPDIR}/gasdens14.dat")
+        with self.assertRaises(ValueError):
+            list(self.output.iter_field("gasdens", [14]))
+        arange(46.0).tofile(f"{TEMPDIR}/gasdens14.dat")
+        with self.assertRaises(ValueError):
+            list(self.output.iter_field("gasdens", [14]))
+        with self.assertRaises(NotImplementedError):
+            list(self.output.iter_field("undefinedfield", [11]))
+
+        for num in range(11, 15):
+            os.remove(f"{TEMPDIR}/gasdens{num}.dat")
+
+    def test_read_unmerged(self) -> None:
+        """Test Output's _read_unmerged method."""
+        gasdens = arange(45.0).reshape((5, 3, 3), order="F")
+        subdomains = {
+            0: (0, 2, 0, 2),
+            1: (2, 3, 0, 2),
+            2: (0, 2, 2, 3),
+            3: (2, 3, 2, 3),
+        }
+        for rank, (y0, y1, z0, z1) in subdomains.items():
+            gasdens[:, y0:y1, z0:z1].ravel(order="F").tofile(
+                f"{TEMPDIR}/gasdens15_{rank}.dat"
+            )
+            with open(f"{TEMPDIR}/grid{rank:03d}.inf", "w") as fid:
+                fid.write(f"CPU_Rank Y0 Y1 Z0 Z1\n{rank} {y0} {y1} {z0} {z1}\n")
+
+        raw = self.output._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+        assert_array_equal(raw, gasdens.ravel(order="F"))
+        datas = list(self.output.iter_field("gasdens", [15]))
+        assert_array_equal(datas[0], gasdens)
+        assert_array_equal(self.output.get_slice("gasdens", 15, y=1), gasdens[:, 1, :])
+        with self.assertRaises(FileNotFoundError):
+            self.output._read_unmerged(f"{TEMPDIR}/gasdens16.dat")
+
+        # A rank's file is missing
+        os.rename(f"{TEMPDIR}/gasdens15_3.dat", f"{TEMPDIR}/gasdens15_3.bak")
+        with self.assertRaises(ValueError):
+            self.output._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+        os.rename(f"{TEMPDIR}/gasdens15_3.bak", f"{TEMPDIR}/gasdens15_3.dat")
+
+        # The subdomains overlap and leave cells uncovered
+        with open(f"{TEMPDIR}/grid003.inf", "w") as fid:
+            fid.write("CPU_Rank Y0 Y1 Z0 Z1\n3 1 2 2 3\n")
+        with self.assertRaises(ValueError):
+            Output(TEMPDIR)._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+
+        # The subdomains exceed the domain
+        with open(f"{TEMPDIR}/grid003.inf", "w") as fid:
+            fid.write("CPU_Rank Y0 Y1 Z0 Z1\n3 2 4 2 3\n")
+        with self.assertRaises(ValueError):
+            Output(TEMPDIR)._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+
+        for rank in subdomains:
+            os.remove(f"{TEMPDIR}/gasdens15_{rank}.dat")
+            os.remove(f"{TEMPDIR}/grid{rank:03d}.inf")
+
+        # Without grid files, a 2D output is split along y in rank order
+        output = Output(TEMPDIR)
+        output._vars["NZ"] = "1"
+        gasdens = arange(15.0).reshape((5, 3, 1), order="F")
+        gasdens[:, :2].ravel(order="F").tofile(f"{TEMPDIR}/gasdens15_0.dat")
+        gasdens[:, 2:].ravel(order="F").tofile(f"{TEMPDIR}/gasdens15_1.dat")
+        raw = output._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+        assert_array_equal(raw, gasdens.ravel(order="F"))
+        os.remove(f"{TEMPDIR}/gasdens15_0.dat")
+        os.remove(f"{TEMPDIR}/gasdens15_1.dat")
+
+        arange(5.0).tofile(f"{TEMPDIR}/gasdens15_0.dat")
+        with self.assertRaises(ValueError):
+            self.output._read_unmerged(f"{TEMPDIR}/gasdens15.dat")
+        os.remove(f"{TEMPDIR}/gasdens15_0.dat")
+
+    def test_map_snapshots(self) -> None:
+        """Test Output's map_snapshots method."""
+        for num in range(11, 14):
+            (arange(45.0) * num).tofile(f"{TEMPDIR}/gasdens{num}.dat")
+
+        for pool in ("process", "thread"):
+            raws = self.output.map_snapshots(
+                attrgetter("raw"), "gasdens", [13, 11, 12], workers=2, pool=pool
+            )
+            for raw, num in zip(raws, [13, 11, 12], strict=True):
+                assert_array_equal(raw, arange(45.0) * num)
+
+            with self.assertRaises(FileNotFoundError):
+                self.output.map_snapshots(
+                    attrgetter("raw"), "gasdens", [11, 99], workers=2, pool=pool
+                )
+            raws = self.output.map_snapshots(
+                attrgetter("raw"), "gasdens", [11, 99], pool=pool, errors="return"
+            )
+            assert_array_equal(raws[0], arange(45.0) * 11)
+            self.assertIsInstance(raws[1], FileNotFoundError)
+
+        with self.assertRaises(ValueError):
+            self.output.map_snapshots(attrgetter("raw"), nums=[11], pool="invalid")
+        with self.assertRaises(ValueError):
+            self.output.map_snapshots(attrgetter("raw"), nums=[11], errors="invalid")
+
+        for num in range(11, 14):
+            os.remove(f"{TEMPDIR}/gasdens{num}.dat")
+
+    @unittest.mock.patch("fargonaut.output.FrameRenderer")
+    @unittest.mock.patch("fargonaut.output.ProcessPoolExecutor", ThreadPoolExecutor)
+    def test_render_frames(self, renderer_mock) -> None:
+        """Test Output's render_frames method."""
+        for num in (8, 9, 10):
+            (arange(45.0) * num).tofile(f"{TEMPDIR}/gasdens{num}.dat")
+
+        outdir = f"{TEMPDIR}/frames"
+        filenames = self.output.render_frames(
+            "gasdens", [10, 8, 9], "xz", "cartesian", outdir, workers=2, vmax=1.0
+        )
+        self.assertEqual(
+            filenames,
+            [Path(outdir) / f"gasdens{num:02d}.png" for num in (10, 8, 9)],
+        )
+        renderer_mock.assert_called_once_with(
+            "cartesian", "xz", 0, None, 1.0, 100, True
+        )
+        render_mock = renderer_mock.return_value.render
+        self.assertEqual(render_mock.call_count, 3)
+        rendered = {call.args[1]: call.args[0] for call in render_mock.call_args_list}
+        for num, filename in zip((10, 8, 9), filenames, strict=True):
+            assert_array_equal(rendered[filename].raw, arange(45.0) * num)
+        self.assertEqual(self.output.render_frames("gasdens", [], outdir=outdir), [])
+
+        os.rmdir(outdir)
+        for num in (8, 9, 10):
+            os.remove(f"{TEMPDIR}/gasdens{num}.dat")
+
     def test_coordinate_system(self) -> None:
         """Test Output's coordinate_system property."""
         self.assertEqual(self.output.coordinate_system, "cylindrical")
@@ -178,95 +519,91 @@ class TestOutput(unittest.TestCase):
         self.output._vars = {"COORDINATES": "spherical"}
         self.assertEqual(self.output.coordinate_system, "spherical")
 
-        del self.output._vars
-        with self.assertRaises(Exception):
-            self.output.coordinate_system
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).coordinate_system
+
+    def test_dtype(self) -> None:
+        """Test Output's dtype property."""
+        self.assertEqual(self.output.dtype, float64)
+
+        self.output._opts = ("X", "Y", "FLOAT")
+        self.assertEqual(self.output.dtype, float32)
 
     def test_includes_ghosts(self) -> None:
         """Test Output's includes_ghosts property."""
         self.assertEqual(self.output.includes_ghosts, False)
 
-        del self.output._opts
-        with self.assertRaises(Exception):
-            self.output.includes_ghosts
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).includes_ghosts
 
     def test_xdomain(self) -> None:
         """Test Output's xdomain property."""
         xdomain = array([-3.14, -1.57, 0.0, 1.57, 3.14])
         assert_array_equal(self.output.xdomain, xdomain)
 
-        del self.output._xdomain
-        with self.assertRaises(Exception):
-            self.output.xdomain
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).xdomain
 
     def test_ydomain(self) -> None:
         """Test Output's ydomain property."""
         ydomain = array([1.0, 2.0, 3.0])
         assert_array_equal(self.output.ydomain, ydomain)
 
-        del self.output._ydomain
-        with self.assertRaises(Exception):
-            self.output.ydomain
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).ydomain
 
     def test_zdomain(self) -> None:
         """Test Output's zdomain property."""
         zdomain = array([-1.0, 0.0, 1.0])
         assert_array_equal(self.output.zdomain, zdomain)
 
-        del self.output._zdomain
-        with self.assertRaises(Exception):
-            self.output.zdomain
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).zdomain
 
     def test_nx(self) -> None:
         """Test Output's nx property."""
         nx = 5
         self.assertEqual(self.output.nx, nx)
 
-        del self.output._vars
-        with self.assertRaises(Exception):
-            self.output.nx
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).nx
 
     def test_ny(self) -> None:
         """Test Output's ny property."""
         ny = 3
         self.assertEqual(self.output.ny, ny)
 
-        del self.output._vars
-        with self.assertRaises(Exception):
-            self.output.ny
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).ny
 
     def test_nz(self) -> None:
         """Test Output's nz property."""
         nz = 3
         self.assertEqual(self.output.nz, nz)
 
-        del self.output._vars
-        with self.assertRaises(Exception):
-            self.output.nz
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).nz
 
     def test_nghx(self) -> None:
         """Test Output's nghx property."""
         nghx = 0
         self.assertEqual(self.output.nghx, nghx)
 
-        del self.output._xdomain
-        with self.assertRaises(Exception):
-            self.output.nghx
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).nghx
 
     def test_nghy(self) -> None:
         """Test Output's nghy property."""
         nghy = 0
         self.assertEqual(self.output.nghy, nghy)
 
-        del self.output._ydomain
-        with self.assertRaises(Exception):
-            self.output.nghy
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).nghy
 
     def test_nghz(self) -> None:
         """Test Output's nghz property."""
         nghz = 0
         self.assertEqual(self.output.nghz, nghz)
 
-        del self.output._zdomain
-        with self.assertRaises(Exception):
-            self.output.nghz
+        with self.assertRaises(FileNotFoundError):
+            Output(MISSING_DIRECTORY).nghz
@@ -0,0 +1,76 @@
+"""Tests for prefetch module."""
+
+import threading
+import unittest
+import unittest.mock
+
+from fargonaut.prefetch import Prefetcher
+
+
+class TestPrefetcher(unittest.TestCase):
+    """Tests for Prefetcher class."""
+
+    def setUp(self) -> None:
+        """Create prefetcher fixture."""
+        self.output = unittest.mock.Mock()
+        self.output.snapshots.return_value = [0, 1, 2, 4, 8]
+        self.output.cache = None
+        self.output._load_field.side_effect = lambda name, num, mmap: (name, num)
+        self.prefetcher = Prefetcher(self.output, 2)
+
+    def tearDown(self) -> None:
+        """Destroy prefetcher fixture."""
+        self.prefetcher.shutdown()
+
+    def test_init(self) -> None:
+        """Test Prefetcher's __init__ method."""
+        self.assertEqual(self.prefetcher.depth, 2)
+        self.assertEqual(self.prefetcher.hits, 0)
+        with self.assertRaises(ValueError):
+            Prefetcher(self.output, 0)
+
+    def test_schedule(self) -> None:
+        """Test Prefetcher's schedule and get methods."""
+        self.assertIsNone(self.prefetcher.get("gasdens", 1))
+
+        self.prefetcher.schedule("gasdens", 1)
+        self.assertEqual(self.prefetcher.get("gasdens", 2), ("gasdens", 2))
+        self.assertEqual(self.prefetcher.get("gasdens", 4), ("gasdens", 4))
+        self.assertIsNone(self.prefetcher.get("gasdens", 8))
+        self.assertEqual(self.prefetcher.hits, 2)
+        self.output._load_field.assert_any_call("gasdens", 2, False)
+
+        self.prefetcher.schedule("gasdens", 8)
+        self.assertIsNone(self.prefetcher.get("gasdens", 9))
+
+        self.output.cache = {("gasdens", 2): None}
+        self.output._load_field.reset_mock()
+        self.prefetcher.schedule("gasdens", 1)
+        self.prefetcher.get("gasdens", 4)
+        self.output._load_field.assert_called_once_with("gasdens", 4, False)
+
+        self.output._load_field.side_effect = FileNotFoundError
+        self.prefetcher.schedule("gasvx", 0)
+        with self.assertRaises(FileNotFoundError):
+            self.prefetcher.get("gasvx", 1)
+
+    def test_cancel(self) -> None:
+        """Test Prefetcher's cancel method."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def load_field(name, num, mmap):
+            started.set()
+            release.wait()
+            return (name, num)
+
+        self.output._load_field.side_effect = load_field
+        prefetcher = Prefetcher(self.output, 2, workers=1)
+        prefetcher.schedule("gasdens", 0)
+        started.wait()
+        prefetcher.cancel()
+        release.set()
+        self.assertIsNone(prefetcher.get("gasdens", 1))
+        self.assertIsNone(prefetcher.get("gasdens", 2))
+        prefetcher.shutdown()
+        self.assertEqual(self.output._load_field.call_count, 1)
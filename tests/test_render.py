@@ -0,0 +1,73 @@
+"""Tests for render module."""
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from numpy import arange, linspace, meshgrid
+from numpy.testing import assert_array_equal
+
+from fargonaut.render import FrameRenderer
+
+TEMPDIR = tempfile.gettempdir()
+FRAME_FILE_NAME = TEMPDIR + "/frame.png"
+
+
+class TestFrameRenderer(unittest.TestCase):
+    """Tests for FrameRenderer class."""
+
+    def setUp(self) -> None:
+        """Create renderer and field fixtures."""
+        self.renderer = FrameRenderer("cartesian", "xy", 0, dpi=10)
+        X, Y = meshgrid(linspace(0, 1, 5), linspace(0, 1, 4), indexing="ij")
+        self.field = unittest.mock.Mock()
+        self.field._get_2D_plot_data.return_value = (
+            X,
+            Y,
+            arange(12.0).reshape((4, 3)),
+            "$x$",
+            "$y$",
+            "$C$",
+        )
+
+    def tearDown(self) -> None:
+        """Delete rendered frames."""
+        if os.path.exists(FRAME_FILE_NAME):
+            os.remove(FRAME_FILE_NAME)
+
+    def test_init(self) -> None:
+        """Test FrameRenderer's __init__ method."""
+        self.assertEqual(self.renderer.csys, "cartesian")
+        self.assertEqual(self.renderer.dims, "xy")
+        self.assertEqual(self.renderer.idx, 0)
+        self.assertIsNone(self.renderer._mesh)
+
+    def test_render(self) -> None:
+        """Test FrameRenderer's render method."""
+        self.renderer.render(self.field, FRAME_FILE_NAME)
+        self.field._get_2D_plot_data.assert_called_once_with("cartesian", "xy", 0)
+        self.assertTrue(os.path.exists(FRAME_FILE_NAME))
+        mesh = self.renderer._mesh
+        self.assertEqual(mesh.get_clim(), (0.0, 11.0))
+        self.assertEqual(mesh.axes.get_xlabel(), "$x$")
+
+        X, Y, C, *labels = self.field._get_2D_plot_data.return_value
+        self.field._get_2D_plot_data.return_value = (X, Y, 2 * C, *labels)
+        os.remove(FRAME_FILE_NAME)
+        self.renderer.render(self.field, FRAME_FILE_NAME)
+        self.assertTrue(os.path.exists(FRAME_FILE_NAME))
+        self.assertIs(self.renderer._mesh, mesh)
+        self.assertEqual(mesh.get_array().max(), 22.0)
+        self.assertEqual(mesh.get_clim(), (0.0, 22.0))
+
+        renderer = FrameRenderer("cartesian", "xy", 0, vmin=-1.0, vmax=1.0, dpi=10)
+        renderer.render(self.field, FRAME_FILE_NAME)
+        renderer.render(self.field, FRAME_FILE_NAME)
+        self.assertEqual(renderer._mesh.get_clim(), (-1.0, 1.0))
+
+        renderer = FrameRenderer("cartesian", "xy", 0, dpi=10, lod=2, lod_method="max")
+        renderer.render(self.field, FRAME_FILE_NAME)
+        assert_array_equal(renderer._mesh.get_array(), [[8.0, 10.0], [20.0, 22.0]])
+        renderer.render(self.field, FRAME_FILE_NAME)
+        self.assertEqual(renderer._mesh.get_array().shape, (2, 2))